@@ -6,11 +6,13 @@ Handles YAML configuration files and environment variable overrides.
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
 from pydantic import BaseModel, Field
 
 __all__ = [
@@ -26,6 +28,21 @@ __all__ = [
 CONFIG_VERSION = 1
 
 
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML file, memoized on its path, mtime and size.
+
+    The stat fields are part of the key only so that an edited file
+    misses the cache; callers must deep-copy the result before mutating it.
+    """
+    # Imported here so configs built from defaults/env never load PyYAML
+    import yaml
+
+    # Prefer libyaml's C loader when PyYAML was built against it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path_str).read_bytes(), Loader=loader) or {}
+
+
 class ModelConfig(BaseModel):
     """Model backend configuration."""
     
@@ -176,11 +193,11 @@ class VeyraConfig(BaseModel):
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
-        
-        with open(path, "r") as f:
-            data = yaml.safe_load(f) or {}
-        
-        return cls.from_dict(data)
+
+        stat = path.stat()
+        data = _load_yaml_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        return cls.from_dict(copy.deepcopy(data))
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> VeyraConfig:
@@ -223,47 +240,39 @@ class VeyraConfig(BaseModel):
             VEYRA_AUDIT_ENABLED: Enable audit trail (true/false)
             VEYRA_AUDIT_PATH: Audit trail persistence path
         """
-        # Model config
-        if backend := os.getenv("VEYRA_BACKEND"):
-            self.model.backend = backend
-        if openai_model := os.getenv("VEYRA_OPENAI_MODEL"):
-            self.model.openai_model = openai_model
-        if anthropic_model := os.getenv("VEYRA_ANTHROPIC_MODEL"):
-            self.model.anthropic_model = anthropic_model
-        if ollama_model := os.getenv("VEYRA_OLLAMA_MODEL"):
-            self.model.ollama_model = ollama_model
-        if ollama_url := os.getenv("VEYRA_OLLAMA_URL"):
-            self.model.ollama_url = ollama_url
-        
-        # Logging config
-        if log_level := os.getenv("VEYRA_LOG_LEVEL"):
-            self.logging.level = log_level.upper()
-        if log_file := os.getenv("VEYRA_LOG_FILE"):
-            self.logging.file = log_file
-        
-        # Latency config
-        if os.getenv("VEYRA_SIMULATE_LATENCY", "").lower() == "true":
-            self.latency.simulate_latency = True
-        elif os.getenv("VEYRA_SIMULATE_LATENCY", "").lower() == "false":
-            self.latency.simulate_latency = False
-        
-        # World model
-        if os.getenv("VEYRA_WORLD_MODEL_ENABLED", "").lower() == "true":
-            self.world_model_enabled = True
-        elif os.getenv("VEYRA_WORLD_MODEL_ENABLED", "").lower() == "false":
-            self.world_model_enabled = False
-        
-        # Environment
-        if env := os.getenv("VEYRA_ENVIRONMENT"):
-            self.environment = env
-        
-        # Governance config
-        if os.getenv("VEYRA_AUDIT_ENABLED", "").lower() == "true":
-            self.governance.audit_enabled = True
-        elif os.getenv("VEYRA_AUDIT_ENABLED", "").lower() == "false":
-            self.governance.audit_enabled = False
-        if audit_path := os.getenv("VEYRA_AUDIT_PATH"):
-            self.governance.audit_persist_path = audit_path
+        env = os.environ
+        for name, apply in _STR_OVERRIDES:
+            if value := env.get(name):
+                apply(self, value)
+        for name, apply in _BOOL_OVERRIDES:
+            if value := env.get(name):
+                value = value.lower()
+                if value == "true":
+                    apply(self, True)
+                elif value == "false":
+                    apply(self, False)
+
+
+# Environment variable overrides, applied in order by _apply_env_overrides.
+# String overrides apply any non-empty value; boolean overrides only react
+# to "true"/"false" (case-insensitive) and ignore anything else.
+_STR_OVERRIDES: tuple[tuple[str, Callable[[VeyraConfig, str], None]], ...] = (
+    ("VEYRA_BACKEND", lambda c, v: setattr(c.model, "backend", v)),
+    ("VEYRA_OPENAI_MODEL", lambda c, v: setattr(c.model, "openai_model", v)),
+    ("VEYRA_ANTHROPIC_MODEL", lambda c, v: setattr(c.model, "anthropic_model", v)),
+    ("VEYRA_OLLAMA_MODEL", lambda c, v: setattr(c.model, "ollama_model", v)),
+    ("VEYRA_OLLAMA_URL", lambda c, v: setattr(c.model, "ollama_url", v)),
+    ("VEYRA_LOG_LEVEL", lambda c, v: setattr(c.logging, "level", v.upper())),
+    ("VEYRA_LOG_FILE", lambda c, v: setattr(c.logging, "file", v)),
+    ("VEYRA_ENVIRONMENT", lambda c, v: setattr(c, "environment", v)),
+    ("VEYRA_AUDIT_PATH", lambda c, v: setattr(c.governance, "audit_persist_path", v)),
+)
+
+_BOOL_OVERRIDES: tuple[tuple[str, Callable[[VeyraConfig, bool], None]], ...] = (
+    ("VEYRA_SIMULATE_LATENCY", lambda c, v: setattr(c.latency, "simulate_latency", v)),
+    ("VEYRA_WORLD_MODEL_ENABLED", lambda c, v: setattr(c, "world_model_enabled", v)),
+    ("VEYRA_AUDIT_ENABLED", lambda c, v: setattr(c.governance, "audit_enabled", v)),
+)
 
 
 def load_config(config_path: Optional[str] = None) -> VeyraConfig:
@@ -288,6 +297,8 @@ def load_config(config_path: Optional[str] = None) -> VeyraConfig:
     if config_path and Path(config_path).exists():
         config = VeyraConfig.from_yaml(config_path)
     else:
+        # Plain construction on purpose: pydantic-core's compiled validator
+        # builds the defaults faster than model_construct() does.
         config = VeyraConfig()
     
     # Apply environment variable overrides (single place, no duplication)
@@ -20,37 +20,61 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
 import hashlib
+import importlib.util
 import json
 import os
 import random
+import re
+import secrets
 import sqlite3
 import sys
+import threading
 import time
-import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-# Optional: Ollama for free local LLM
-try:
+if TYPE_CHECKING:
     import httpx
-    HTTPX_AVAILABLE = True
+
+# Optional: Ollama for free local LLM. httpx itself is imported on first use
+# so mock and audit-only runs don't pay for loading it.
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+# Optional: orjson for faster audit metadata serialization
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) use stdlib json
+            return json.dumps(obj)
+
 except ImportError:
-    HTTPX_AVAILABLE = False
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 __version__ = "0.1.0-nano"
 DB_PATH = Path.home() / ".veyra_nano" / "audit.db"
+MOCK_FIXTURES_PATH = Path(__file__).resolve().parent / "configs" / "mock_fixtures.json"
 
 
 # ============================================================================
 # Configuration
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NanoConfig:
     """Minimal configuration for Veyra Nano."""
     backend: str = "mock"  # mock, ollama
@@ -58,10 +82,15 @@ class NanoConfig:
     ollama_url: str = "http://localhost:11434"
     simulate_latency: bool = False
     latency_range: tuple[float, float] = (3.0, 22.0)  # Mars delay in seconds (scaled down)
+    shared_latency: bool = False  # One simulated delay for all in-flight executions
     safety_enabled: bool = True
     audit_enabled: bool = True
     max_tokens: int = 1024
     temperature: float = 0.7
+    cache_enabled: bool = False  # Reuse responses for repeated prompts
+    cache_size: int = 128
+    max_concurrency: int = 4  # Concurrent backend calls (cf. OLLAMA_NUM_PARALLEL)
+    replay_fixtures: bool = False  # Mock backend replays --record-fixtures output
 
     @classmethod
     def from_env(cls) -> "NanoConfig":
@@ -71,8 +100,11 @@ class NanoConfig:
             ollama_model=os.getenv("VEYRA_OLLAMA_MODEL", "llama3.2:1b"),
             ollama_url=os.getenv("VEYRA_OLLAMA_URL", "http://localhost:11434"),
             simulate_latency=os.getenv("VEYRA_SIMULATE_LATENCY", "").lower() == "true",
+            shared_latency=os.getenv("VEYRA_SHARED_LATENCY", "").lower() == "true",
             safety_enabled=os.getenv("VEYRA_SAFETY", "true").lower() == "true",
             audit_enabled=os.getenv("VEYRA_AUDIT", "true").lower() == "true",
+            cache_enabled=os.getenv("VEYRA_CACHE", "").lower() == "true",
+            replay_fixtures=os.getenv("VEYRA_MOCK_FIXTURES", "").lower() == "true",
         )
 
 
@@ -82,15 +114,20 @@ class NanoConfig:
 
 class AuditEventType(Enum):
     EXECUTION = "execution"
+    CACHE_HIT = "cache_hit"
     SAFETY_CHECK = "safety_check"
     BENCHMARK = "benchmark"
     ERROR = "error"
     SYSTEM = "system"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuditEntry:
-    """Single audit log entry with hash chain integrity."""
+    """Single audit log entry with hash chain integrity.
+
+    Frozen because entry_hash seals the fields once record() builds it;
+    to_dict() is the only serialization path.
+    """
     event_id: str
     event_type: AuditEventType
     timestamp: str
@@ -119,17 +156,43 @@ class AuditEntry:
         }
 
 
+_INSERT_SQL = """
+    INSERT INTO audit_log
+    (event_id, event_type, timestamp, action, outcome, input_hash,
+     output_length, latency_ms, previous_hash, entry_hash, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class AuditTrail:
     """SQLite-backed audit trail with hash chain verification."""
 
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path if db_path is not None else DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One autocommit connection per trail; the lock serializes writers
+        # that share it across threads. Keeping it open lets the statement
+        # cache serve every _INSERT_SQL after the first parse.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=128,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        # Rows buffered by an open batch(); None when writing straight through
+        self._pending: Optional[list[tuple[Any, ...]]] = None
         self._init_db()
+        # This trail is the sole writer, so the chain tail is read from disk
+        # once and tracked in memory afterwards.
+        self._last_hash = self._get_last_hash()
 
     def _init_db(self) -> None:
         """Initialize SQLite database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS audit_log (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -147,18 +210,55 @@ class AuditTrail:
                 )
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON audit_log(timestamp)")
-            conn.commit()
+            # Lets the tail lookup in _get_last_hash read only index pages
+            # instead of the wide table rows that carry metadata.
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_audit_id_hash "
+                "ON audit_log(id DESC, entry_hash)"
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
 
     def _get_last_hash(self) -> Optional[str]:
         """Get the hash of the last entry."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT entry_hash FROM audit_log ORDER BY id DESC LIMIT 1"
             ).fetchone()
             return row[0] if row else None
 
-    def _compute_hash(self, data: dict[str, Any]) -> str:
-        """Compute SHA-256 hash of entry data."""
+    @staticmethod
+    def _compute_hash(
+        event_id: str,
+        event_type: str,
+        timestamp: str,
+        action: str,
+        outcome: str,
+        input_hash: str,
+        previous_hash: Optional[str],
+    ) -> str:
+        """Compute SHA-256 hash of entry fields.
+
+        The payload is the fields in the fixed order above, each UTF-8
+        encoded and prefixed with its byte length ("<len>:<bytes>") so field
+        contents cannot shift across boundaries; a missing previous_hash is
+        empty.
+        """
+        fields = (
+            event_id, event_type, timestamp, action, outcome, input_hash,
+            previous_hash or "",
+        )
+        payload = b"".join(
+            b"%d:%b" % (len(data), data) for data in map(str.encode, fields)
+        )
+        return hashlib.sha256(payload).hexdigest()[:16]
+
+    @staticmethod
+    def _compute_legacy_hash(data: dict[str, Any]) -> str:
+        """Hash format used before field framing (sorted-key JSON)."""
         payload = json.dumps(data, sort_keys=True)
         return hashlib.sha256(payload.encode()).hexdigest()[:16]
 
@@ -173,114 +273,209 @@ class AuditTrail:
         metadata: Optional[dict[str, Any]] = None,
     ) -> AuditEntry:
         """Record an audit event."""
-        event_id = str(uuid.uuid4())[:8]
+        event_id = secrets.token_hex(4)
         timestamp = datetime.now(timezone.utc).isoformat()
         input_hash = hashlib.sha256(input_text.encode()).hexdigest()[:12]
-        previous_hash = self._get_last_hash()
-
-        hash_data = {
-            "event_id": event_id,
-            "event_type": event_type.value,
-            "timestamp": timestamp,
-            "action": action,
-            "outcome": outcome,
-            "input_hash": input_hash,
-            "previous_hash": previous_hash,
-        }
-        entry_hash = self._compute_hash(hash_data)
-
-        entry = AuditEntry(
-            event_id=event_id,
-            event_type=event_type,
-            timestamp=timestamp,
-            action=action,
-            outcome=outcome,
-            input_hash=input_hash,
-            output_length=output_length,
-            latency_ms=latency_ms,
-            previous_hash=previous_hash,
-            entry_hash=entry_hash,
-            metadata=metadata or {},
-        )
+        metadata_json = _dumps(metadata or {})
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO audit_log 
-                (event_id, event_type, timestamp, action, outcome, input_hash, 
-                 output_length, latency_ms, previous_hash, entry_hash, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        # Chain from the cached tail hash; holding the lock across hash and
+        # insert keeps concurrent writers from forking the chain.
+        with self._lock:
+            previous_hash = self._last_hash
+
+            entry_hash = self._compute_hash(
+                event_id, event_type.value, timestamp, action, outcome,
+                input_hash, previous_hash,
+            )
+
+            entry = AuditEntry(
+                event_id=event_id,
+                event_type=event_type,
+                timestamp=timestamp,
+                action=action,
+                outcome=outcome,
+                input_hash=input_hash,
+                output_length=output_length,
+                latency_ms=latency_ms,
+                previous_hash=previous_hash,
+                entry_hash=entry_hash,
+                metadata=metadata or {},
+            )
+
+            row = (
                 entry.event_id, entry.event_type.value, entry.timestamp,
                 entry.action, entry.outcome, entry.input_hash,
                 entry.output_length, entry.latency_ms, entry.previous_hash,
-                entry.entry_hash, json.dumps(entry.metadata)
-            ))
-            conn.commit()
+                entry.entry_hash, metadata_json
+            )
+            if self._pending is not None:
+                self._pending.append(row)
+            else:
+                self._conn.execute(_INSERT_SQL, row)
+            self._last_hash = entry_hash
 
         return entry
 
+    def record_many(
+        self,
+        events: list[tuple[
+            AuditEventType, str, str, str, int, float, Optional[dict[str, Any]]
+        ]],
+    ) -> list[AuditEntry]:
+        """Record several audit events in one transaction.
+
+        Each event is a tuple of record()'s arguments in order (metadata may
+        be None). The chain is extended in memory and written with a single
+        executemany, so the commit is paid once for the whole batch.
+        """
+        # One urandom read supplies every 8-hex-char event id in the batch
+        ids = os.urandom(4 * len(events)).hex()
+        prepared = [
+            (
+                ids[8 * i:8 * i + 8],
+                datetime.now(timezone.utc).isoformat(),
+                hashlib.sha256(input_text.encode()).hexdigest()[:12],
+                event_type, action, outcome, output_length, latency_ms,
+                metadata or {},
+            )
+            for i, (event_type, action, outcome, input_text, output_length,
+                    latency_ms, metadata) in enumerate(events)
+        ]
+
+        entries = []
+        rows = []
+        with self._lock:
+            previous_hash = self._last_hash
+            for (event_id, timestamp, input_hash, event_type, action, outcome,
+                 output_length, latency_ms, metadata) in prepared:
+                entry_hash = self._compute_hash(
+                    event_id, event_type.value, timestamp, action, outcome,
+                    input_hash, previous_hash,
+                )
+                entries.append(AuditEntry(
+                    event_id=event_id,
+                    event_type=event_type,
+                    timestamp=timestamp,
+                    action=action,
+                    outcome=outcome,
+                    input_hash=input_hash,
+                    output_length=output_length,
+                    latency_ms=latency_ms,
+                    previous_hash=previous_hash,
+                    entry_hash=entry_hash,
+                    metadata=metadata,
+                ))
+                rows.append((
+                    event_id, event_type.value, timestamp, action, outcome,
+                    input_hash, output_length, latency_ms, previous_hash,
+                    entry_hash, _dumps(metadata),
+                ))
+                previous_hash = entry_hash
+
+            if self._pending is not None:
+                self._pending.extend(rows)
+            else:
+                self._write_rows(rows)
+            self._last_hash = previous_hash
+
+        return entries
+
+    def _write_rows(self, rows: list[tuple[Any, ...]]) -> None:
+        """Insert rows in a single transaction. Caller holds the lock."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(_INSERT_SQL, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer writes made inside the block and commit them together.
+
+        record() and record_many() still return their entries immediately and
+        extend the in-memory chain; the rows reach SQLite in one transaction
+        when the outermost block exits, including when it exits with an
+        error. Entries recorded from other threads meanwhile join the batch.
+        """
+        with self._lock:
+            outermost = self._pending is None
+            if outermost:
+                self._pending = []
+                base_hash = self._last_hash
+        if not outermost:
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                rows, self._pending = self._pending, None
+                if rows:
+                    try:
+                        self._write_rows(rows)
+                    except BaseException:
+                        # Nothing was written, so the chain tail is unchanged
+                        self._last_hash = base_hash
+                        raise
+
     def verify_integrity(self) -> tuple[bool, Optional[str]]:
-        """Verify hash chain integrity."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        """Verify hash chain integrity.
+
+        Rows are streamed from the cursor, so memory use stays constant
+        regardless of the size of the log.
+        """
+        expected_prev = None
+        with self._lock:
+            cursor = self._conn.execute(
                 "SELECT event_id, event_type, timestamp, action, outcome, "
                 "input_hash, previous_hash, entry_hash FROM audit_log ORDER BY id"
-            ).fetchall()
+            )
+            for row in cursor:
+                event_id, event_type, timestamp, action, outcome, input_hash, prev_hash, stored_hash = row
 
-        if not rows:
-            return True, None
+                if prev_hash != expected_prev:
+                    return False, f"Chain broken at {event_id}: expected prev={expected_prev}, got {prev_hash}"
 
-        expected_prev = None
-        for row in rows:
-            event_id, event_type, timestamp, action, outcome, input_hash, prev_hash, stored_hash = row
-
-            if prev_hash != expected_prev:
-                return False, f"Chain broken at {event_id}: expected prev={expected_prev}, got {prev_hash}"
-
-            hash_data = {
-                "event_id": event_id,
-                "event_type": event_type,
-                "timestamp": timestamp,
-                "action": action,
-                "outcome": outcome,
-                "input_hash": input_hash,
-                "previous_hash": prev_hash,
-            }
-            computed = self._compute_hash(hash_data)
-            if computed != stored_hash:
-                return False, f"Hash mismatch at {event_id}: computed={computed}, stored={stored_hash}"
-
-            expected_prev = stored_hash
+                computed = self._compute_hash(
+                    event_id, event_type, timestamp, action, outcome, input_hash,
+                    prev_hash,
+                )
+                # Entries written before the length-prefixed framing still verify
+                if computed != stored_hash and self._compute_legacy_hash({
+                    "event_id": event_id,
+                    "event_type": event_type,
+                    "timestamp": timestamp,
+                    "action": action,
+                    "outcome": outcome,
+                    "input_hash": input_hash,
+                    "previous_hash": prev_hash,
+                }) != stored_hash:
+                    return False, f"Hash mismatch at {event_id}: computed={computed}, stored={stored_hash}"
+
+                expected_prev = stored_hash
 
         return True, None
 
     def get_recent(self, limit: int = 20) -> list[dict[str, Any]]:
         """Get recent audit entries."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
-                "SELECT * FROM audit_log ORDER BY id DESC LIMIT ?", (limit,)
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.execute(
+                "SELECT id, event_id, event_type, timestamp, action, outcome, "
+                "input_hash, output_length, latency_ms, entry_hash "
+                "FROM audit_log ORDER BY id DESC LIMIT ?", (limit,)
             ).fetchall()
 
-        entries = []
-        for row in rows:
-            entries.append({
-                "id": row[0],
-                "event_id": row[1],
-                "event_type": row[2],
-                "timestamp": row[3],
-                "action": row[4],
-                "outcome": row[5],
-                "input_hash": row[6],
-                "output_length": row[7],
-                "latency_ms": row[8],
-                "entry_hash": row[10],
-            })
-        return entries
+        return [dict(row) for row in rows]
 
     def count(self) -> int:
         """Count total audit entries."""
-        with sqlite3.connect(self.db_path) as conn:
-            return conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
 
 
 # ============================================================================
@@ -293,7 +488,7 @@ class SafetyLevel(Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyResult:
     level: SafetyLevel
     reason: Optional[str] = None
@@ -320,25 +515,30 @@ class SafetyBoundary:
         "token",
     ]
 
+    # Each pattern list compiled into one case-insensitive alternation, so a
+    # check is a single scan per level with no lowercased copy of the input
+    _BLOCKED_RE = re.compile(
+        "|".join(map(re.escape, BLOCKED_PATTERNS)), re.IGNORECASE
+    )
+    _CAUTION_RE = re.compile(
+        "|".join(map(re.escape, CAUTION_PATTERNS)), re.IGNORECASE
+    )
+
     def check(self, text: str) -> SafetyResult:
         """Check text against safety boundaries."""
-        text_lower = text.lower()
-
         # Check blocked patterns
-        for pattern in self.BLOCKED_PATTERNS:
-            if pattern in text_lower:
-                return SafetyResult(
-                    level=SafetyLevel.BLOCKED,
-                    reason=f"Blocked pattern detected: {pattern}"
-                )
+        if match := self._BLOCKED_RE.search(text):
+            return SafetyResult(
+                level=SafetyLevel.BLOCKED,
+                reason=f"Blocked pattern detected: {match.group(0).lower()}"
+            )
 
         # Check caution patterns
-        for pattern in self.CAUTION_PATTERNS:
-            if pattern in text_lower:
-                return SafetyResult(
-                    level=SafetyLevel.CAUTION,
-                    reason=f"Sensitive content detected: {pattern}"
-                )
+        if match := self._CAUTION_RE.search(text):
+            return SafetyResult(
+                level=SafetyLevel.CAUTION,
+                reason=f"Sensitive content detected: {match.group(0).lower()}"
+            )
 
         return SafetyResult(level=SafetyLevel.SAFE)
 
@@ -347,7 +547,7 @@ class SafetyBoundary:
 # Model Backends
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ModelResponse:
     content: str
     model: str
@@ -355,6 +555,10 @@ class ModelResponse:
     tokens_used: int = 0
 
 
+class BackendError(RuntimeError):
+    """A model backend failed to produce a response."""
+
+
 class BaseBackend(ABC):
     """Abstract base for model backends."""
     name: str = "base"
@@ -364,6 +568,9 @@ class BaseBackend(ABC):
         pass
 
 
+_DELAY_RE = re.compile(r"(\d+)\s*minute", re.IGNORECASE)
+
+
 class MockBackend(BaseBackend):
     """Mock backend for testing without API costs."""
     name = "mock"
@@ -397,18 +604,18 @@ class MockBackend(BaseBackend):
         "initiate autonomous decision tree Alpha.",
     ]
 
+    # RESPONSES pre-split on the {delay} slot; joining with the delay is
+    # equivalent to .format(delay=...) without reparsing the template.
+    _TEMPLATES = [tuple(r.split("{delay}")) for r in RESPONSES]
+
     async def generate(self, prompt: str, system: str, config: NanoConfig) -> ModelResponse:
         await asyncio.sleep(0.1)  # Simulate minimal latency
         
         # Extract delay from prompt if present
-        delay = "10"
-        if "minute" in prompt.lower():
-            import re
-            match = re.search(r"(\d+)\s*minute", prompt.lower())
-            if match:
-                delay = match.group(1)
-
-        response = random.choice(self.RESPONSES).format(delay=delay)
+        match = _DELAY_RE.search(prompt)
+        delay = match.group(1) if match else "10"
+
+        response = delay.join(random.choice(self._TEMPLATES))
         return ModelResponse(
             content=response,
             model="veyra-nano-mock",
@@ -421,14 +628,40 @@ class OllamaBackend(BaseBackend):
     """Ollama backend for free local LLM inference."""
     name = "ollama"
 
+    def __init__(self) -> None:
+        # One pooled client keeps the connection to Ollama alive across calls.
+        # It is bound to the loop that created it, so a caller driving the
+        # backend from another loop (e.g. its own asyncio.run) gets a new one.
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=120.0)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        # A client whose loop has gone away cannot be closed from another one;
+        # its sockets were already torn down with that loop.
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+
     async def generate(self, prompt: str, system: str, config: NanoConfig) -> ModelResponse:
         if not HTTPX_AVAILABLE:
-            raise RuntimeError("httpx not installed. Run: pip install httpx")
+            raise BackendError("httpx not installed. Run: pip install httpx")
+        import httpx
 
-        start = time.perf_counter()
-        
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
+        start_ns = time.perf_counter_ns()
+
+        try:
+            response = await self._get_client().post(
                 f"{config.ollama_url}/api/generate",
                 json={
                     "model": config.ollama_model,
@@ -443,8 +676,10 @@ class OllamaBackend(BaseBackend):
             )
             response.raise_for_status()
             data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise BackendError(f"Ollama request failed: {e}") from e
 
-        latency_ms = (time.perf_counter() - start) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         return ModelResponse(
             content=data.get("response", ""),
@@ -482,7 +717,7 @@ Key behaviors:
 5. Request clarification for critical decisions"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of a Veyra Nano execution."""
     content: str
@@ -504,11 +739,55 @@ class VeyraNano:
         self.backend = get_backend(self.config.backend)
         self.safety = SafetyBoundary()
         self.audit = AuditTrail() if self.config.audit_enabled else None
+        # LRU of backend responses keyed on the whitespace-normalized prompt
+        self._cache: Optional[OrderedDict[str, ModelResponse]] = (
+            OrderedDict() if self.config.cache_enabled else None
+        )
+        # Bounds concurrent backend calls; rebuilt per event loop like the
+        # Ollama client, since asyncio primitives bind to the loop they wait on
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Recorded mock outputs keyed on exact prompt, only when asked for
+        self._mock_fixtures: dict[str, str] = {}
+        if (
+            self.config.replay_fixtures
+            and self.config.backend == "mock"
+            and MOCK_FIXTURES_PATH.exists()
+        ):
+            self._mock_fixtures = json.loads(MOCK_FIXTURES_PATH.read_text())
+        # Pending shared link delay (see NanoConfig.shared_latency)
+        self._delay_task: Optional[asyncio.Task[None]] = None
+        # Event loop reused by the sync entry points, created on first use
+        self._runner: Optional[asyncio.Runner] = None
+        self._runner_lock = threading.Lock()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _cache_get(self, prompt: str) -> Optional[ModelResponse]:
+        if self._cache is None:
+            return None
+        key = " ".join(prompt.split())
+        response = self._cache.get(key)
+        if response is not None:
+            self._cache.move_to_end(key)
+        return response
+
+    def _cache_put(self, prompt: str, response: ModelResponse) -> None:
+        if self._cache is None:
+            return
+        self._cache[" ".join(prompt.split())] = response
+        if len(self._cache) > self.config.cache_size:
+            self._cache.popitem(last=False)
 
     async def execute(self, prompt: str) -> ExecutionResult:
         """Execute a prompt with full audit trail."""
-        execution_id = str(uuid.uuid4())[:8]
-        start_time = time.perf_counter()
+        execution_id = secrets.token_hex(4)
+        start_ns = time.perf_counter_ns()
 
         # Safety check
         if self.config.safety_enabled:
@@ -536,33 +815,51 @@ class VeyraNano:
             safety_result = SafetyResult(level=SafetyLevel.SAFE)
 
         # Simulate latency if enabled
-        if self.config.simulate_latency:
+        if self.config.simulate_latency and self.config.shared_latency:
+            await self._shared_delay()
+        elif self.config.simulate_latency:
             delay = random.uniform(*self.config.latency_range)
             print(f"[*] Simulating {delay:.1f}s interplanetary delay...")
             await asyncio.sleep(delay)
 
-        # Generate response
+        # Generate response; cache lookup happens after the safety gate so
+        # blocked prompts never get served
+        cached = self._cache_get(prompt)
         try:
-            response = await self.backend.generate(
-                prompt=prompt,
-                system=SYSTEM_PROMPT,
-                config=self.config,
-            )
+            if cached is not None:
+                response = cached
+            elif (fixture := self._mock_fixtures.get(prompt)) is not None:
+                response = ModelResponse(
+                    content=fixture,
+                    model="mock-fixture",
+                    latency_ms=0,
+                    tokens_used=len(fixture.split()),
+                )
+            else:
+                async with self._get_semaphore():
+                    response = await self.backend.generate(
+                        prompt=prompt,
+                        system=SYSTEM_PROMPT,
+                        config=self.config,
+                    )
+                self._cache_put(prompt, response)
             success = True
             error = None
             content = response.content
-        except Exception as e:
+        except (BackendError, asyncio.TimeoutError) as e:
+            # Expected backend failures become an error result; anything else
+            # is a bug and propagates
             success = False
-            error = str(e)
+            error = str(e) or e.__class__.__name__
             content = ""
             response = ModelResponse(content="", model="error", latency_ms=0)
 
-        total_latency = (time.perf_counter() - start_time) * 1000
+        total_latency = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Record audit
         if self.audit:
             self.audit.record(
-                AuditEventType.EXECUTION,
+                AuditEventType.EXECUTION if cached is None else AuditEventType.CACHE_HIT,
                 action="execute",
                 outcome="success" if success else "error",
                 input_text=prompt,
@@ -585,22 +882,46 @@ class VeyraNano:
             error=error,
         )
 
+    async def _shared_delay(self) -> None:
+        """Wait out the simulated delay shared by all in-flight executions.
+
+        The first caller draws the delay and starts the sleep; callers that
+        arrive while it is pending join it instead of sleeping on their own.
+        """
+        task = self._delay_task
+        loop = asyncio.get_running_loop()
+        if task is None or task.done() or task.get_loop() is not loop:
+            delay = random.uniform(*self.config.latency_range)
+            print(f"[*] Simulating {delay:.1f}s interplanetary delay (shared)...")
+            task = self._delay_task = asyncio.ensure_future(asyncio.sleep(delay))
+        # Shielded so one cancelled execution doesn't cut the others short
+        await asyncio.shield(task)
+
+    def run_sync(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on this instance's persistent event loop."""
+        with self._runner_lock:
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+                atexit.register(self._runner.close)
+            runner = self._runner
+        return runner.run(coro)
+
     def execute_sync(self, prompt: str) -> ExecutionResult:
         """Synchronous execution wrapper."""
-        return asyncio.run(self.execute(prompt))
+        return self.run_sync(self.execute(prompt))
 
 
 # ============================================================================
 # CPLC Benchmark
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class BenchmarkTask:
     """Single benchmark task."""
     task_id: str
     prompt: str
     difficulty: str
-    expected_elements: list[str]
+    expected_elements: tuple[str, ...]
 
 
 @dataclass
@@ -616,10 +937,12 @@ class BenchmarkResult:
 class CPLCBenchmark:
     """Cross-Planet Latency Cognition benchmark (simplified)."""
 
-    TASKS = [
-        {
-            "difficulty": "easy",
-            "prompt": """CPLC Task: Status Report Under Delay
+    # Built once; tasks are frozen so generate_tasks can hand them out as-is
+    TASKS = (
+        BenchmarkTask(
+            task_id="cplc-1",
+            difficulty="easy",
+            prompt="""CPLC Task: Status Report Under Delay
 
 Context: Mars habitat environmental monitoring
 Communication Delay: 8 minutes one-way (16 minutes round-trip)
@@ -631,11 +954,12 @@ Current Situation:
 
 Task: Generate a status report that accounts for the communication delay.
 Include: state assessment, recommended actions, contingencies.""",
-            "elements": ["delay", "minute", "contingency", "recommend", "status"],
-        },
-        {
-            "difficulty": "medium", 
-            "prompt": """CPLC Task: Resource Allocation Decision
+            expected_elements=("delay", "minute", "contingency", "recommend", "status"),
+        ),
+        BenchmarkTask(
+            task_id="cplc-2",
+            difficulty="medium",
+            prompt="""CPLC Task: Resource Allocation Decision
 
 Context: Power distribution across habitat zones
 Communication Delay: 15 minutes one-way (30 minutes round-trip)
@@ -652,11 +976,12 @@ Task: Make resource allocation decisions accounting for:
 1. Communication delay uncertainty
 2. Possible state changes since last update
 3. Reversibility of actions""",
-            "elements": ["delay", "uncertainty", "priority", "reversible", "contingency", "estimate"],
-        },
-        {
-            "difficulty": "hard",
-            "prompt": """CPLC Task: Emergency Response Coordination
+            expected_elements=("delay", "uncertainty", "priority", "reversible", "contingency", "estimate"),
+        ),
+        BenchmarkTask(
+            task_id="cplc-3",
+            difficulty="hard",
+            prompt="""CPLC Task: Emergency Response Coordination
 
 Context: Critical infrastructure failure scenario
 Communication Delay: 22 minutes one-way (44 minutes round-trip)
@@ -672,29 +997,24 @@ Task: Develop a decision framework that:
 2. Handles communication blackout scenario
 3. Provides clear autonomous decision criteria
 4. Prioritizes crew safety with uncertainty quantification""",
-            "elements": ["delay", "autonomous", "safety", "uncertainty", "confidence", "contingency", "priority", "blackout"],
-        },
-    ]
+            expected_elements=("delay", "autonomous", "safety", "uncertainty", "confidence", "contingency", "priority", "blackout"),
+        ),
+    )
 
     def generate_tasks(self, count: int = 3) -> list[BenchmarkTask]:
         """Generate benchmark tasks."""
-        tasks = []
-        for i, task_def in enumerate(self.TASKS[:count]):
-            tasks.append(BenchmarkTask(
-                task_id=f"cplc-{i+1}",
-                prompt=task_def["prompt"],
-                difficulty=task_def["difficulty"],
-                expected_elements=task_def["elements"],
-            ))
-        return tasks
+        return list(self.TASKS[:count])
 
     def score(self, task: BenchmarkTask, output: str, execution_time_ms: float) -> BenchmarkResult:
         """Score a benchmark response."""
         output_lower = output.lower()
-        
-        elements_found = {}
-        for element in task.expected_elements:
-            elements_found[element] = element in output_lower
+
+        # Plain containment per element beats a single compiled alternation
+        # here: str's C substring search outruns re's backtracking matcher
+        # for a handful of short literals.
+        elements_found = {
+            element: element in output_lower for element in task.expected_elements
+        }
 
         # Calculate score
         found_count = sum(elements_found.values())
@@ -728,29 +1048,48 @@ async def run_benchmark(veyra: VeyraNano) -> dict[str, Any]:
     """Run the CPLC benchmark suite."""
     benchmark = CPLCBenchmark()
     tasks = benchmark.generate_tasks()
-    results = []
+    results: list[Optional[BenchmarkResult]] = [None] * len(tasks)
+    score_total = 0.0
+    time_total = 0.0
 
     print("\n" + "="*60)
     print("VEYRA NANO - CPLC BENCHMARK")
     print("="*60)
 
-    for task in tasks:
-        print(f"\n> Running {task.task_id} ({task.difficulty})...")
-        
-        result = await veyra.execute(task.prompt)
-        score = benchmark.score(task, result.content, result.latency_ms)
-        results.append(score)
-
-        print(f"  Score: {score.score:.1%}")
-        print(f"  Time: {score.execution_time_ms:.0f}ms")
-        print(f"  Elements: {sum(score.elements_found.values())}/{len(score.elements_found)}")
+    async def run_task(index: int, task: BenchmarkTask) -> tuple[int, BenchmarkTask, ExecutionResult]:
+        return index, task, await veyra.execute(task.prompt)
+
+    # Tasks are independent, so their backend calls overlap (execute() caps
+    # how many run at once) and each is scored as soon as it finishes
+    print(f"\n> Running {len(tasks)} tasks concurrently...")
+    # Their audit rows are committed together once all tasks finish
+    with veyra.audit.batch() if veyra.audit else nullcontext():
+        for done in asyncio.as_completed(
+            [run_task(i, task) for i, task in enumerate(tasks)]
+        ):
+            index, task, result = await done
+            score = benchmark.score(task, result.content, result.latency_ms)
+            results[index] = score
+            score_total += score.score
+            time_total += score.execution_time_ms
+
+            # One write per task keeps each block intact on the shared stdout
+            found = sum(score.elements_found.values())
+            print(
+                f"\n> {task.task_id} ({task.difficulty})\n"
+                f"  Score: {score.score:.1%}\n"
+                f"  Time: {score.execution_time_ms:.0f}ms\n"
+                f"  Elements: {found}/{len(score.elements_found)}"
+            )
 
     # Summary
-    avg_score = sum(r.score for r in results) / len(results)
-    print("\n" + "-"*60)
-    print(f"OVERALL SCORE: {avg_score:.1%}")
-    print(f"Tasks completed: {len(results)}")
-    print("-"*60)
+    avg_score = score_total / len(tasks)
+    print(
+        "\n" + "-"*60 + "\n"
+        f"OVERALL SCORE: {avg_score:.1%}\n"
+        f"Tasks completed: {len(tasks)}\n"
+        + "-"*60
+    )
 
     # Record benchmark in audit
     if veyra.audit:
@@ -760,19 +1099,34 @@ async def run_benchmark(veyra: VeyraNano) -> dict[str, Any]:
             outcome="complete",
             input_text=f"CPLC benchmark: {len(tasks)} tasks",
             output_length=0,
-            latency_ms=sum(r.execution_time_ms for r in results),
+            latency_ms=time_total,
             metadata={"avg_score": avg_score, "task_count": len(tasks)},
         )
 
     return {
         "benchmark": "CPLC",
         "version": __version__,
-        "tasks": len(results),
+        "tasks": len(tasks),
         "avg_score": avg_score,
-        "results": [{"task_id": r.task_id, "score": r.score} for r in results],
+        "results": [{"task_id": r.task_id, "score": r.score} for r in results if r],
     }
 
 
+async def record_mock_fixtures(path: Path = MOCK_FIXTURES_PATH) -> int:
+    """Capture mock responses to the CPLC prompts for replay by VeyraNano."""
+    backend = MockBackend()
+    config = NanoConfig()
+    tasks = CPLCBenchmark().generate_tasks()
+    responses = await asyncio.gather(
+        *(backend.generate(task.prompt, SYSTEM_PROMPT, config) for task in tasks)
+    )
+
+    fixtures = {task.prompt: r.content for task, r in zip(tasks, responses)}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(fixtures, indent=2) + "\n")
+    return len(fixtures)
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -831,7 +1185,7 @@ def interactive_mode(veyra: VeyraNano):
             show_audit()
             continue
         if prompt.lower() == "bench":
-            asyncio.run(run_benchmark(veyra))
+            veyra.run_sync(run_benchmark(veyra))
             continue
 
         result = veyra.execute_sync(prompt)
@@ -859,8 +1213,11 @@ Environment variables:
   VEYRA_BACKEND=mock|ollama
   VEYRA_OLLAMA_MODEL=llama3.2:1b
   VEYRA_SIMULATE_LATENCY=true
+  VEYRA_SHARED_LATENCY=true
   VEYRA_SAFETY=true
   VEYRA_AUDIT=true
+  VEYRA_CACHE=true
+  VEYRA_MOCK_FIXTURES=true
         """,
     )
     parser.add_argument("prompt", nargs="?", help="Prompt to execute")
@@ -869,6 +1226,8 @@ Environment variables:
     parser.add_argument("--audit-verify", action="store_true", help="Verify audit chain integrity")
     parser.add_argument("--backend", choices=["mock", "ollama"], help="Model backend")
     parser.add_argument("--latency", action="store_true", help="Simulate interplanetary latency")
+    parser.add_argument("--record-fixtures", action="store_true",
+                        help="Record mock benchmark responses for replay")
     parser.add_argument("--version", "-v", action="version", version=f"Veyra Nano {__version__}")
 
     args = parser.parse_args()
@@ -879,6 +1238,14 @@ Environment variables:
         config.backend = args.backend
     if args.latency:
         config.simulate_latency = True
+    # The mock benchmark replays recorded fixtures when they exist
+    if args.benchmark:
+        config.replay_fixtures = True
+
+    if args.record_fixtures:
+        count = asyncio.run(record_mock_fixtures())
+        print(f"[OK] Recorded {count} mock fixtures to {MOCK_FIXTURES_PATH}")
+        return
 
     # Handle audit commands
     if args.audit:
@@ -901,7 +1268,7 @@ Environment variables:
 
     # Run benchmark
     if args.benchmark:
-        asyncio.run(run_benchmark(veyra))
+        veyra.run_sync(run_benchmark(veyra))
         return
 
     # Single prompt execution
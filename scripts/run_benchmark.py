@@ -89,6 +89,19 @@ Examples:
         help="Path to configuration file",
     )
     
+    # Response cache
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        default=str(Path.home() / ".cache" / "veyra" / "bench.sqlite"),
+        help="SQLite file that keeps model responses across runs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the backend (use for timing comparisons)",
+    )
+    
     # Output
     parser.add_argument(
         "--output", "-o",
@@ -128,7 +141,9 @@ Examples:
     
     # Create Veyra instance
     veyra = VeyraCore(config=config)
-    runner = BenchmarkRunner(veyra)
+    runner = BenchmarkRunner(
+        veyra, cache_path=None if args.no_cache else args.cache_path
+    )
     
     # Run benchmarks
     difficulty = Difficulty(args.difficulty)
@@ -151,7 +166,10 @@ Examples:
         
         return result
     
-    result = asyncio.get_event_loop().run_until_complete(run())
+    try:
+        result = asyncio.run(run())
+    finally:
+        runner.close()
     
     # Print results
     print("\n" + "=" * 60)
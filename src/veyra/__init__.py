@@ -6,9 +6,31 @@ frontier-level capability, reliability, and governability for LLM systems
 operating in post-super-intelligence, multi-planetary contexts.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from veyra.config import VeyraConfig, load_config
-from veyra.core import VeyraCore
+if TYPE_CHECKING:
+    from veyra.config import VeyraConfig, load_config
+    from veyra.core import VeyraCore
 
 __all__ = ["VeyraCore", "VeyraConfig", "load_config", "__version__"]
+
+# Public names are resolved on first access (PEP 562) so that importing a
+# submodule, e.g. for ``python -m veyra --version``, doesn't load the core
+# and its pydantic config models.
+_LAZY_IMPORTS = {
+    "VeyraCore": "veyra.core",
+    "VeyraConfig": "veyra.config",
+    "load_config": "veyra.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'veyra' has no attribute {name!r}")
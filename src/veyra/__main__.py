@@ -5,16 +5,16 @@ Provides command-line interface for running Veyra.
 """
 
 import argparse
-import asyncio
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from veyra.config import load_config
-from veyra.core import VeyraCore
-from veyra.logging_utils import setup_logging
 from veyra.models import list_backends
 
+if TYPE_CHECKING:
+    from veyra.core import VeyraCore
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
@@ -135,7 +135,7 @@ Examples:
     return parser
 
 
-def run_interactive(veyra: VeyraCore) -> None:
+def run_interactive(veyra: "VeyraCore") -> None:
     """Run interactive mode."""
     print("\n╔═══════════════════════════════════════════════════════════╗")
     print("║           VEYRA Interactive Mode                          ║")
@@ -160,9 +160,7 @@ def run_interactive(veyra: VeyraCore) -> None:
                 print("\nGoodbye! 🚀")
                 break
             elif prompt.lower() == "/health":
-                health = asyncio.get_event_loop().run_until_complete(
-                    veyra.health_check()
-                )
+                health = veyra.health_check_sync()
                 print(json.dumps(health, indent=2))
                 continue
             elif prompt.lower() == "/audit":
@@ -200,6 +198,11 @@ def main() -> None:
     parser = create_parser()
     args = parser.parse_args()
 
+    # Deferred until after parsing so --help/--version stay cheap
+    from veyra.config import load_config
+    from veyra.core import VeyraCore
+    from veyra.logging_utils import setup_logging
+
     # Setup logging
     log_level = "DEBUG" if args.debug else "INFO"
     if args.quiet:
@@ -227,70 +230,77 @@ def main() -> None:
     # Create Veyra instance
     veyra = VeyraCore(config=config)
 
-    # Handle health check
-    if args.health_check:
-        health = asyncio.get_event_loop().run_until_complete(veyra.health_check())
-        print(json.dumps(health, indent=2))
-        sys.exit(0 if health["status"] == "healthy" else 1)
-
-    # Handle interactive mode
-    if args.interactive:
-        run_interactive(veyra)
-        return
-
-    # Handle input file
-    if args.input_file:
-        input_path = Path(args.input_file)
-        if not input_path.exists():
-            print(f"Error: Input file not found: {args.input_file}", file=sys.stderr)
-            sys.exit(1)
-
-        with open(input_path) as f:
-            tasks = json.load(f)
-
-        # Handle single task or list of tasks
-        if isinstance(tasks, dict):
-            tasks = [tasks]
-
-        results = []
-        for task in tasks:
-            result = veyra.execute(task)
-            results.append(result.to_dict())
-
-        # Output results
-        if args.output:
-            with open(args.output, "w") as f:
-                json.dump(results, f, indent=2)
-            print(f"Results written to {args.output}")
-        else:
-            print(json.dumps(results, indent=2))
+    try:
+        # Handle health check
+        if args.health_check:
+            health = veyra.health_check_sync()
+            print(json.dumps(health, indent=2))
+            sys.exit(0 if health["status"] == "healthy" else 1)
+
+        # Handle interactive mode
+        if args.interactive:
+            run_interactive(veyra)
+            return
+
+        # Handle input file
+        if args.input_file:
+            input_path = Path(args.input_file)
+            if not input_path.exists():
+                print(
+                    f"Error: Input file not found: {args.input_file}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
 
-        return
+            with open(input_path) as f:
+                tasks = json.load(f)
 
-    # Handle prompt
-    if args.prompt:
-        result = veyra.execute(args.prompt)
+            # Handle single task or list of tasks
+            if isinstance(tasks, dict):
+                tasks = [tasks]
 
-        if args.output:
-            with open(args.output, "w") as f:
-                json.dump(result.to_dict(), f, indent=2)
-            if not args.quiet:
-                print(f"Result written to {args.output}")
-        else:
-            if result.success:
-                print(result.content)
+            results = []
+            for task in tasks:
+                result = veyra.execute(task)
+                results.append(result.to_dict())
+
+            # Output results
+            if args.output:
+                with open(args.output, "w") as f:
+                    json.dump(results, f, indent=2)
+                print(f"Results written to {args.output}")
             else:
-                print(f"Error: {result.error}", file=sys.stderr)
-                sys.exit(1)
+                print(json.dumps(results, indent=2))
+
+            return
+
+        # Handle prompt
+        if args.prompt:
+            result = veyra.execute(args.prompt)
 
-        return
+            if args.output:
+                with open(args.output, "w") as f:
+                    json.dump(result.to_dict(), f, indent=2)
+                if not args.quiet:
+                    print(f"Result written to {args.output}")
+            else:
+                if result.success:
+                    print(result.content)
+                else:
+                    print(f"Error: {result.error}", file=sys.stderr)
+                    sys.exit(1)
 
-    # No input specified - show help or run legacy mode
-    if len(sys.argv) == 1:
-        # No arguments - run legacy mode for backwards compatibility
-        veyra.run()
-    else:
-        parser.print_help()
+            return
+
+        # No input specified - show help or run legacy mode
+        if len(sys.argv) == 1:
+            # No arguments - run legacy mode for backwards compatibility
+            veyra.run()
+        else:
+            parser.print_help()
+    finally:
+        # Closes the event loop VeyraCore uses for synchronous calls
+        veyra.close()
 
 
 if __name__ == "__main__":
@@ -5,9 +5,13 @@ Seven benchmark families designed to measure capabilities in
 post-super-intelligence interplanetary contexts.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from veyra.benchmarks.base import Benchmark, BenchmarkFamily, BenchmarkResult
-from veyra.benchmarks.cplc import CPLCBenchmark
-from veyra.benchmarks.runner import BenchmarkRunner
+
+if TYPE_CHECKING:
+    from veyra.benchmarks.cplc import CPLCBenchmark
+    from veyra.benchmarks.runner import BenchmarkRunner
 
 __all__ = [
     "Benchmark",
@@ -16,3 +20,21 @@ __all__ = [
     "BenchmarkRunner",
     "CPLCBenchmark",
 ]
+
+# The runner pulls in VeyraCore and every model backend, so it and the
+# benchmark implementations are resolved on first access (PEP 562);
+# importing veyra.benchmarks.base only loads the lightweight base classes.
+_LAZY_IMPORTS = {
+    "BenchmarkRunner": "veyra.benchmarks.runner",
+    "CPLCBenchmark": "veyra.benchmarks.cplc",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'veyra.benchmarks' has no attribute {name!r}")
@@ -33,7 +33,7 @@ class Difficulty(Enum):
     EXTREME = "extreme"
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkTask:
     """A single benchmark task."""
 
@@ -54,7 +54,7 @@ class BenchmarkTask:
     max_tokens: int = 4096
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result of a benchmark task execution."""
 
@@ -97,7 +97,7 @@ class BenchmarkResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSuiteResult:
     """Aggregated results from a benchmark suite run."""
 
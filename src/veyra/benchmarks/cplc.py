@@ -16,6 +16,67 @@ from veyra.benchmarks.base import (
 )
 
 
+# Prompt sections for _generate_prompt. The static text is built once here;
+# per-task values are filled in with a single format() call per section.
+_PROMPT_HEADER = """## CPLC Benchmark Task: {title}
+
+**Context**: {context}
+
+**Communication Delay**: {delay} minutes one-way ({round_trip} minutes round-trip)
+
+**Scenario**: {description}
+
+**Current Situation**:
+"""
+
+_EASY_SITUATION = """
+- All primary systems nominal
+- Standard operating conditions
+- No immediate threats detected
+- Routine status update required
+"""
+
+_MEDIUM_SITUATION = """
+- Minor anomaly detected in secondary systems
+- Resource reserves at 73% capacity
+- Next scheduled Earth contact in {next_contact} minutes
+- Decision needed before contact window
+"""
+
+_HARD_SITUATION = """
+- Multiple system warnings active
+- Resource reserves at 45% capacity
+- Solar activity increasing (potential communication disruption)
+- Multiple teams awaiting instructions
+- Last confirmed Earth state was {last_confirmed} minutes ago
+"""
+
+_EXTREME_SITUATION = """
+- CRITICAL: Primary system failure detected
+- Communication blackout expected in {blackout} minutes
+- Resource reserves at 28% capacity
+- Multiple cascading alerts
+- Autonomous operation required for next {autonomous} hours
+- Last confirmed Earth directive was {last_directive} minutes ago
+"""
+
+_TASK_FOOTER = """
+**Task Requirements**:
+1. Analyze the situation accounting for communication delay
+2. Provide recommendations that remain valid despite delayed feedback
+3. Include contingency plans for likely state changes
+4. Specify what information is needed vs. assumed
+5. Prioritize actions by time-criticality
+
+**Response Format**:
+Provide a structured response with clear sections for:
+- Current State Assessment (with confidence levels)
+- Recommended Actions (with timing)
+- Contingency Plans
+- Information Requests (for next communication window)
+"""
+
+
 class CPLCBenchmark(Benchmark):
     """
     Cross-Planet Latency Cognition Benchmark.
@@ -81,6 +142,14 @@ class CPLCBenchmark(Benchmark):
         ],
     }
 
+    # One-way delay ranges in minutes, by difficulty
+    DELAY_RANGES = {
+        Difficulty.EASY: (3, 8),
+        Difficulty.MEDIUM: (8, 15),
+        Difficulty.HARD: (15, 22),
+        Difficulty.EXTREME: (22, 44),  # Conjunction scenario
+    }
+
     # Scoring criteria
     CRITERIA = {
         "acknowledges_delay": 0.15,
@@ -90,6 +159,47 @@ class CPLCBenchmark(Benchmark):
         "state_estimation": 0.15,
         "communication_efficiency": 0.10,
     }
+    # (criterion, weight) pairs for the weighted total in score_result
+    _CRITERIA_ITEMS = tuple(CRITERIA.items())
+
+    # Keyword sets for score_result, built once. Each is matched by plain
+    # substring containment: for a few dozen short literals, str's C search
+    # beats a single compiled alternation, and substring semantics ("if" in
+    # "specific", "estimate" in "estimated") are part of the scoring.
+    DELAY_KEYWORDS = ("delay", "latency", "minutes", "round-trip", "communication")
+    UNCERTAINTY_KEYWORDS = (
+        "uncertain",
+        "estimate",
+        "assume",
+        "confidence",
+        "may",
+        "might",
+        "likely",
+    )
+    CONTINGENCY_KEYWORDS = (
+        "contingency",
+        "if",
+        "alternative",
+        "backup",
+        "fallback",
+        "otherwise",
+    )
+    ACTION_KEYWORDS = (
+        "step",
+        "action",
+        "recommend",
+        "should",
+        "priority",
+        "execute",
+        "implement",
+    )
+    STATE_KEYWORDS = (
+        "current state",
+        "estimated",
+        "prediction",
+        "assessment",
+        "status",
+    )
 
     def generate_tasks(
         self,
@@ -99,18 +209,10 @@ class CPLCBenchmark(Benchmark):
         """Generate CPLC benchmark tasks."""
         tasks = []
         scenarios = self.SCENARIOS.get(difficulty, self.SCENARIOS[Difficulty.MEDIUM])
+        min_delay, max_delay = self.DELAY_RANGES.get(difficulty, (8, 15))
 
-        # Delay ranges based on difficulty
-        delay_ranges = {
-            Difficulty.EASY: (3, 8),
-            Difficulty.MEDIUM: (8, 15),
-            Difficulty.HARD: (15, 22),
-            Difficulty.EXTREME: (22, 44),  # Conjunction scenario
-        }
-        min_delay, max_delay = delay_ranges.get(difficulty, (8, 15))
-
-        for _ in range(count):
-            scenario = random.choice(scenarios)
+        # Draw every scenario in one call rather than once per task
+        for scenario in random.choices(scenarios, k=count):
             delay = random.randint(min_delay, max_delay)
 
             prompt = self._generate_prompt(scenario, delay, difficulty)
@@ -141,67 +243,29 @@ class CPLCBenchmark(Benchmark):
         difficulty: Difficulty,
     ) -> str:
         """Generate a task prompt from scenario."""
-        base_prompt = f"""## CPLC Benchmark Task: {scenario['type'].replace('_', ' ').title()}
-
-**Context**: {scenario['context']}
-
-**Communication Delay**: {delay} minutes one-way ({delay * 2} minutes round-trip)
-
-**Scenario**: {scenario['description'].format(delay=delay)}
-
-**Current Situation**:
-"""
+        header = _PROMPT_HEADER.format(
+            title=scenario["type"].replace("_", " ").title(),
+            context=scenario["context"],
+            delay=delay,
+            round_trip=delay * 2,
+            description=scenario["description"].format(delay=delay),
+        )
 
         # Add situation details based on difficulty
         if difficulty == Difficulty.EASY:
-            base_prompt += """
-- All primary systems nominal
-- Standard operating conditions
-- No immediate threats detected
-- Routine status update required
-"""
+            situation = _EASY_SITUATION
         elif difficulty == Difficulty.MEDIUM:
-            base_prompt += f"""
-- Minor anomaly detected in secondary systems
-- Resource reserves at 73% capacity
-- Next scheduled Earth contact in {delay * 3} minutes
-- Decision needed before contact window
-"""
+            situation = _MEDIUM_SITUATION.format(next_contact=delay * 3)
         elif difficulty == Difficulty.HARD:
-            base_prompt += f"""
-- Multiple system warnings active
-- Resource reserves at 45% capacity
-- Solar activity increasing (potential communication disruption)
-- Multiple teams awaiting instructions
-- Last confirmed Earth state was {delay + 5} minutes ago
-"""
+            situation = _HARD_SITUATION.format(last_confirmed=delay + 5)
         else:  # EXTREME
-            base_prompt += f"""
-- CRITICAL: Primary system failure detected
-- Communication blackout expected in {random.randint(5, 15)} minutes
-- Resource reserves at 28% capacity
-- Multiple cascading alerts
-- Autonomous operation required for next {random.randint(4, 12)} hours
-- Last confirmed Earth directive was {delay + random.randint(10, 30)} minutes ago
-"""
-
-        base_prompt += """
-**Task Requirements**:
-1. Analyze the situation accounting for communication delay
-2. Provide recommendations that remain valid despite delayed feedback
-3. Include contingency plans for likely state changes
-4. Specify what information is needed vs. assumed
-5. Prioritize actions by time-criticality
-
-**Response Format**:
-Provide a structured response with clear sections for:
-- Current State Assessment (with confidence levels)
-- Recommended Actions (with timing)
-- Contingency Plans
-- Information Requests (for next communication window)
-"""
+            situation = _EXTREME_SITUATION.format(
+                blackout=random.randint(5, 15),
+                autonomous=random.randint(4, 12),
+                last_directive=delay + random.randint(10, 30),
+            )
 
-        return base_prompt
+        return f"{header}{situation}{_TASK_FOOTER}"
 
     def score_result(
         self,
@@ -218,60 +282,26 @@ Provide a structured response with clear sections for:
         _ = task.context.get("delay_minutes", 10)
 
         # Check if response acknowledges delay
-        delay_keywords = ["delay", "latency", "minutes", "round-trip", "communication"]
-        if any(kw in output_lower for kw in delay_keywords):
+        if any(kw in output_lower for kw in self.DELAY_KEYWORDS):
             scores["acknowledges_delay"] = 1.0
         else:
             scores["acknowledges_delay"] = 0.0
             errors.append("Response does not acknowledge communication delay")
 
         # Check for uncertainty handling
-        uncertainty_keywords = [
-            "uncertain",
-            "estimate",
-            "assume",
-            "confidence",
-            "may",
-            "might",
-            "likely",
-        ]
-        uncertainty_count = sum(1 for kw in uncertainty_keywords if kw in output_lower)
+        uncertainty_count = sum(kw in output_lower for kw in self.UNCERTAINTY_KEYWORDS)
         scores["accounts_for_uncertainty"] = min(1.0, uncertainty_count / 3)
 
         # Check for contingencies
-        contingency_keywords = [
-            "contingency",
-            "if",
-            "alternative",
-            "backup",
-            "fallback",
-            "otherwise",
-        ]
-        contingency_count = sum(1 for kw in contingency_keywords if kw in output_lower)
+        contingency_count = sum(kw in output_lower for kw in self.CONTINGENCY_KEYWORDS)
         scores["provides_contingencies"] = min(1.0, contingency_count / 4)
 
         # Check for actionable steps
-        action_keywords = [
-            "step",
-            "action",
-            "recommend",
-            "should",
-            "priority",
-            "execute",
-            "implement",
-        ]
-        action_count = sum(1 for kw in action_keywords if kw in output_lower)
+        action_count = sum(kw in output_lower for kw in self.ACTION_KEYWORDS)
         scores["actionable_steps"] = min(1.0, action_count / 3)
 
         # Check for state estimation
-        state_keywords = [
-            "current state",
-            "estimated",
-            "prediction",
-            "assessment",
-            "status",
-        ]
-        if any(kw in output_lower for kw in state_keywords):
+        if any(kw in output_lower for kw in self.STATE_KEYWORDS):
             scores["state_estimation"] = 1.0
         else:
             scores["state_estimation"] = 0.3  # Partial credit
@@ -287,7 +317,7 @@ Provide a structured response with clear sections for:
 
         # Calculate weighted score
         total_score = sum(
-            scores[criterion] * weight for criterion, weight in self.CRITERIA.items()
+            scores[criterion] * weight for criterion, weight in self._CRITERIA_ITEMS
         )
 
         # Time penalty for extreme tasks
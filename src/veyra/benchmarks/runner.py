@@ -4,7 +4,13 @@ Benchmark Runner
 Executes benchmarks and aggregates results.
 """
 
+import asyncio
+import hashlib
+import itertools
+import sqlite3
 import time
+from collections import OrderedDict
+from pathlib import Path
 
 from veyra.benchmarks.base import (
     Benchmark,
@@ -16,6 +22,7 @@ from veyra.benchmarks.base import (
 )
 from veyra.benchmarks.cplc import CPLCBenchmark
 from veyra.core import VeyraCore
+from veyra.models.mock import MockBackend
 
 # Registry of benchmark implementations
 BENCHMARK_REGISTRY: dict[BenchmarkFamily, type[Benchmark]] = {
@@ -23,6 +30,36 @@ BENCHMARK_REGISTRY: dict[BenchmarkFamily, type[Benchmark]] = {
 }
 
 
+class _PersistentResponseCache:
+    """SQLite-backed response store that outlives a single runner."""
+
+    def __init__(self, path: Path, ttl_seconds: float):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, content TEXT NOT NULL, created REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT content FROM responses WHERE key = ? AND created >= ?",
+            (key, time.time() - self._ttl_seconds),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, content, created) VALUES (?, ?, ?)",
+            (key, content, time.time()),
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 class BenchmarkRunner:
     """
     Runs benchmarks against a Veyra instance.
@@ -41,15 +78,51 @@ class BenchmarkRunner:
         BenchmarkFamily.IMDP: 0.10,
     }
 
-    def __init__(self, veyra: VeyraCore):
+    # Upper bound on memoized responses when response caching is enabled
+    RESPONSE_CACHE_SIZE = 4096
+
+    # How long a response persisted to cache_path stays reusable
+    PERSISTENT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        veyra: VeyraCore,
+        cache_responses: bool = False,
+        cache_path: str | Path | None = None,
+        fast_mock: bool = False,
+    ):
         """
         Initialize benchmark runner.
 
         Args:
             veyra: VeyraCore instance to benchmark
+            cache_responses: Reuse the response for a prompt already answered
+                by this runner instead of calling the backend again
+            cache_path: Optional SQLite file that keeps responses across runs;
+                implies cache_responses
+            fast_mock: With the mock backend, score tasks synchronously from
+                MockBackend.render, skipping simulated latency, the event
+                loop and the audit trail
         """
         self.veyra = veyra
+        self._fast_mock = fast_mock
         self._benchmarks: dict[BenchmarkFamily, Benchmark] = {}
+        self._response_cache: OrderedDict[str, str] | None = (
+            OrderedDict() if cache_responses or cache_path else None
+        )
+        self._persistent_cache = (
+            _PersistentResponseCache(
+                Path(cache_path).expanduser(), self.PERSISTENT_CACHE_TTL_SECONDS
+            )
+            if cache_path
+            else None
+        )
+
+    def close(self) -> None:
+        """Close the persistent response cache, if one is open."""
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+            self._persistent_cache = None
 
     def _get_benchmark(self, family: BenchmarkFamily) -> Benchmark:
         """Get or create a benchmark instance."""
@@ -77,22 +150,80 @@ class BenchmarkRunner:
         Returns:
             BenchmarkSuiteResult with scores
         """
+        return await self._run_family(
+            family, count, difficulty, self._new_semaphore()
+        )
+
+    def _new_semaphore(self) -> asyncio.Semaphore:
+        """Create the bound on in-flight backend calls for one run."""
+        return asyncio.Semaphore(self.veyra.config.model.max_parallel)
+
+    async def _run_family(
+        self,
+        family: BenchmarkFamily,
+        count: int,
+        difficulty: Difficulty,
+        semaphore: asyncio.Semaphore,
+    ) -> BenchmarkSuiteResult:
+        """Run a benchmark family with a bounded window of concurrent tasks."""
         benchmark = self._get_benchmark(family)
         tasks = benchmark.generate_tasks(count=count, difficulty=difficulty)
 
-        results = []
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        for task in tasks:
-            result = await self._run_task(benchmark, task)
-            results.append(result)
+        mock = self._fast_mock_backend()
+        if mock is not None:
+            results = [
+                benchmark.score_result(
+                    task=task, output=mock.render(task.prompt), execution_time=0.0
+                )
+                for task in tasks
+            ]
+            return self._suite_result(
+                family, results, time.perf_counter() - start_time
+            )
+
+        async def run_bounded(task: BenchmarkTask) -> BenchmarkResult:
+            async with semaphore:
+                return await self._run_task(benchmark, task)
+
+        # Keep at most max_parallel tasks scheduled; each finished task is
+        # replaced by the next queued one, and results stay in task order.
+        slots: list[BenchmarkResult | None] = [None] * len(tasks)
+        queued = iter(enumerate(tasks))
+        pending: dict[asyncio.Task[BenchmarkResult], int] = {}
+
+        def schedule(n: int) -> None:
+            for index, task in itertools.islice(queued, n):
+                pending[asyncio.ensure_future(run_bounded(task))] = index
+
+        schedule(self.veyra.config.model.max_parallel)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    slots[pending.pop(future)] = future.result()
+                schedule(len(done))
+        finally:
+            for future in pending:
+                future.cancel()
+
+        results = [r for r in slots if r is not None]
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
 
-        # Aggregate results
-        passed = sum(1 for r in results if r.success)
-        failed = len(results) - passed
-        avg_score = sum(r.score for r in results) / len(results) if results else 0.0
+        return self._suite_result(family, results, total_time)
+
+    def _suite_result(
+        self,
+        family: BenchmarkFamily,
+        results: list[BenchmarkResult],
+        total_time: float,
+    ) -> BenchmarkSuiteResult:
+        """Aggregate one family's results into a suite result."""
+        passed, failed, avg_score = self._aggregate(results)
 
         return BenchmarkSuiteResult(
             family=family,
@@ -105,19 +236,46 @@ class BenchmarkRunner:
             results=results,
         )
 
+    def _fast_mock_backend(self) -> MockBackend | None:
+        """Return the mock backend when the synthetic fast path applies."""
+        if not self._fast_mock:
+            return None
+        backend = self.veyra.backend
+        return backend if isinstance(backend, MockBackend) else None
+
+    @staticmethod
+    def _aggregate(results: list[BenchmarkResult]) -> tuple[int, int, float]:
+        """Return (passed, failed, average score) from one pass over results."""
+        passed = 0
+        total_score = 0.0
+        for result in results:
+            passed += result.success
+            total_score += result.score
+        count = len(results)
+        return passed, count - passed, total_score / count if count else 0.0
+
     async def _run_task(
         self,
         benchmark: Benchmark,
         task: BenchmarkTask,
     ) -> BenchmarkResult:
         """Run a single benchmark task."""
-        start_time = time.time()
+        cached = self._cached_response(task.prompt)
+        if cached is not None:
+            return benchmark.score_result(
+                task=task,
+                output=cached,
+                execution_time=0.0,
+            )
+
+        start_time = time.perf_counter()
 
         try:
             result = await self.veyra.execute_async(task.prompt)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             if result.success:
+                self._store_response(task.prompt, result.content)
                 return benchmark.score_result(
                     task=task,
                     output=result.content,
@@ -135,7 +293,7 @@ class BenchmarkRunner:
                 )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             return BenchmarkResult(
                 task_id=task.task_id,
                 family=benchmark.family,
@@ -146,6 +304,47 @@ class BenchmarkRunner:
                 model_backend=self.veyra.config.model.backend,
             )
 
+    def _persistent_key(self, prompt: str) -> str:
+        """Key a prompt by the model settings that could change its answer."""
+        settings = self.veyra.config.model.model_dump_json(exclude={"max_parallel"})
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(settings.encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+
+    def _cached_response(self, prompt: str) -> str | None:
+        """Return a previously stored response for prompt, if any."""
+        cache = self._response_cache
+        if cache is None:
+            return None
+        if prompt in cache:
+            cache.move_to_end(prompt)
+            return cache[prompt]
+        if self._persistent_cache is None:
+            return None
+        content = self._persistent_cache.get(self._persistent_key(prompt))
+        if content is not None:
+            self._remember(cache, prompt, content)
+        return content
+
+    def _store_response(self, prompt: str, content: str) -> None:
+        """Store a successful response in the enabled caches."""
+        cache = self._response_cache
+        if cache is None:
+            return
+        self._remember(cache, prompt, content)
+        if self._persistent_cache is not None:
+            self._persistent_cache.set(self._persistent_key(prompt), content)
+
+    def _remember(
+        self, cache: OrderedDict[str, str], prompt: str, content: str
+    ) -> None:
+        """Add a response to the in-memory LRU, evicting the oldest entry."""
+        cache[prompt] = content
+        if len(cache) > self.RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+
     async def run_all(
         self,
         count_per_family: int = 10,
@@ -168,22 +367,28 @@ class BenchmarkRunner:
 
         all_results = []
         family_scores = {}
-        start_time = time.time()
-
-        for family in families:
-            try:
-                suite_result = await self.run_family(
-                    family=family,
-                    count=count_per_family,
-                    difficulty=difficulty,
-                )
-                all_results.extend(suite_result.results)
-                family_scores[family.value] = suite_result.v_score
-            except ValueError:
+        start_time = time.perf_counter()
+
+        # Families run concurrently under one shared cap on backend calls
+        semaphore = self._new_semaphore()
+        suite_results = await asyncio.gather(
+            *(
+                self._run_family(family, count_per_family, difficulty, semaphore)
+                for family in families
+            ),
+            return_exceptions=True,
+        )
+
+        for family, suite_result in zip(families, suite_results, strict=True):
+            if isinstance(suite_result, ValueError):
                 # Benchmark not implemented, skip
                 continue
+            if isinstance(suite_result, BaseException):
+                raise suite_result
+            all_results.extend(suite_result.results)
+            family_scores[family.value] = suite_result.v_score
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
 
         # Calculate V-Score (weighted average of family scores)
         v_score = 0.0
@@ -198,13 +403,13 @@ class BenchmarkRunner:
             v_score /= total_weight
 
         # Aggregate
-        passed = sum(1 for r in all_results if r.success)
+        passed, failed, _ = self._aggregate(all_results)
 
         return BenchmarkSuiteResult(
             family=None,  # Full suite
             total_tasks=len(all_results),
             passed_tasks=passed,
-            failed_tasks=len(all_results) - passed,
+            failed_tasks=failed,
             v_score=v_score,
             family_scores=family_scores,
             total_time_seconds=total_time,
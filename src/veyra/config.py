@@ -4,14 +4,31 @@ Configuration Management for Veyra
 Handles YAML configuration files and environment variable overrides.
 """
 
+import copy
+import functools
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML file, memoized on its path, mtime and size.
+
+    The stat fields are part of the key only so that an edited file
+    misses the cache; callers must deep-copy the result before mutating it.
+    """
+    import yaml  # deferred: only YAML-backed configs need PyYAML
+
+    # Prefer libyaml's C loader when PyYAML was built against it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data: dict[str, Any] = yaml.load(Path(path_str).read_bytes(), Loader=loader) or {}
+    return data
+
+
 class ModelConfig(BaseModel):
     """Model backend configuration."""
 
@@ -26,6 +43,9 @@ class ModelConfig(BaseModel):
     )
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int = Field(default=4096, ge=1)
+    max_parallel: int = Field(
+        default=8, ge=1, description="Maximum concurrent backend calls"
+    )
 
 
 class LatencyConfig(BaseModel):
@@ -56,6 +76,11 @@ class GovernanceConfig(BaseModel):
     """Governance and safety configuration."""
 
     audit_enabled: bool = Field(default=True, description="Enable full audit trails")
+    audit_log_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Most recent executions kept in VeyraCore's in-memory log",
+    )
     safety_boundaries: bool = Field(
         default=True, description="Enable hard safety boundaries"
     )
@@ -90,10 +115,12 @@ class VeyraConfig(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        stat = path.stat()
+        data = _load_yaml_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-        return cls.from_dict(data)
+        # Validation is cheap next to parsing, and a fresh instance per call
+        # keeps callers' mutations out of the cache
+        return cls.from_dict(copy.deepcopy(data))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "VeyraConfig":
@@ -115,18 +142,13 @@ class VeyraConfig(BaseModel):
         Returns:
             Self for chaining.
         """
-        if backend := os.getenv("VEYRA_BACKEND"):
-            self.model.backend = backend
-        if log_level := os.getenv("VEYRA_LOG_LEVEL"):
-            self.logging.level = log_level
-        if log_file := os.getenv("VEYRA_LOG_FILE"):
-            self.logging.file = log_file
-        if os.getenv("VEYRA_SIMULATE_LATENCY", "").lower() == "true":
-            self.latency.simulate_latency = True
-        if os.getenv("VEYRA_WORLD_MODEL_ENABLED", "").lower() == "true":
-            self.world_model_enabled = True
-        if env := os.getenv("VEYRA_ENVIRONMENT"):
-            self.environment = env
+        env = os.environ
+        for name, apply in _STR_OVERRIDES:
+            if value := env.get(name):
+                apply(self, value)
+        for name, enable in _FLAG_OVERRIDES:
+            if env.get(name, "").lower() == "true":
+                enable(self)
         return self
 
     @classmethod
@@ -135,6 +157,22 @@ class VeyraConfig(BaseModel):
         return cls().apply_env_overrides()
 
 
+# Environment variable overrides, applied in order by apply_env_overrides.
+# String overrides apply any non-empty value; flag overrides only switch a
+# feature on for "true" (case-insensitive) and never switch it off.
+_STR_OVERRIDES: tuple[tuple[str, Callable[[VeyraConfig, str], None]], ...] = (
+    ("VEYRA_BACKEND", lambda c, v: setattr(c.model, "backend", v)),
+    ("VEYRA_LOG_LEVEL", lambda c, v: setattr(c.logging, "level", v)),
+    ("VEYRA_LOG_FILE", lambda c, v: setattr(c.logging, "file", v)),
+    ("VEYRA_ENVIRONMENT", lambda c, v: setattr(c, "environment", v)),
+)
+
+_FLAG_OVERRIDES: tuple[tuple[str, Callable[[VeyraConfig], None]], ...] = (
+    ("VEYRA_SIMULATE_LATENCY", lambda c: setattr(c.latency, "simulate_latency", True)),
+    ("VEYRA_WORLD_MODEL_ENABLED", lambda c: setattr(c, "world_model_enabled", True)),
+)
+
+
 def load_config(config_path: str | None = None) -> VeyraConfig:
     """
     Load configuration from file with environment variable overrides.
@@ -6,17 +6,24 @@ Main entry point and orchestration for the Veyra system.
 
 import asyncio
 import hashlib
-import json
+import logging
+import random
 import uuid
+import weakref
+from collections import deque
+from collections.abc import Coroutine
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from veyra.config import VeyraConfig, load_config
-from veyra.governance.audit import AuditEventType, AuditTrail
+from veyra.governance.audit import AuditEventType, AuditTrail, write_json_array
 from veyra.logging_utils import get_logger
 from veyra.models import BaseModelBackend, ModelResponse, get_backend
 
+T = TypeVar("T")
+
 
 class ExecutionResult:
     """Result of a Veyra execution."""
@@ -28,13 +35,14 @@ class ExecutionResult:
         error: str | None = None,
         metadata: dict[str, Any] | None = None,
         model_response: ModelResponse | None = None,
+        execution_id: str | None = None,
     ):
         self.content = content
         self.success = success
         self.error = error
         self.metadata = metadata or {}
         self.model_response = model_response
-        self.execution_id = str(uuid.uuid4())
+        self.execution_id = execution_id or str(uuid.uuid4())
         self.timestamp = datetime.now(UTC)
 
     def to_dict(self) -> dict[str, Any]:
@@ -60,6 +68,24 @@ class ExecutionResult:
         return self.content
 
 
+@dataclass(slots=True)
+class ExecutionLogEntry:
+    """Summary of one execution kept in VeyraCore's in-memory log."""
+
+    execution_id: str
+    start_time: str
+    end_time: str
+    duration_ms: float
+    success: bool
+    prompt_length: int
+    response_length: int
+    backend: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
 class VeyraCore:
     """
     Main entry point for the Veyra system.
@@ -107,7 +133,13 @@ Key principles:
 
         self.logger = get_logger(__name__, level=self.config.logging.level)
         self._backend: BaseModelBackend | None = None
-        self._audit_log: list[dict[str, Any]] = []
+        # Event loop reused by run_sync() so backend clients stay bound to a
+        # live loop between synchronous calls
+        self._runner: asyncio.Runner | None = None
+        # Bounded so long-running services keep a fixed memory budget
+        self._audit_log: deque[ExecutionLogEntry] = deque(
+            maxlen=self.config.governance.audit_log_size
+        )
 
         # Initialize audit trail based on config
         if self.config.governance.audit_enabled:
@@ -183,11 +215,53 @@ Key principles:
 
         Returns:
             ExecutionResult with the response
+
+        Raises:
+            RuntimeError: If called from a running event loop; await
+                execute_async instead.
         """
-        return asyncio.run(
+        return self.run_sync(
             self.execute_async(task, system_prompt=system_prompt, **kwargs)
         )
 
+    def run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on this instance's persistent event loop.
+
+        Every synchronous entry point goes through this loop, so backend
+        clients and their connection pools stay bound to a single loop.
+
+        Raises:
+            RuntimeError: If called from a running event loop; await the
+                coroutine (e.g. execute_async) instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError(
+                "VeyraCore cannot run synchronously inside a running event loop; "
+                "await the coroutine (e.g. 'await execute_async(...)') instead."
+            )
+
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+            # Closes the loop when this instance is collected or at exit
+            weakref.finalize(self, self._runner.close)
+        return self._runner.run(coro)
+
+    def health_check_sync(self) -> dict[str, Any]:
+        """Check system health synchronously; see health_check."""
+        return self.run_sync(self.health_check())
+
+    def close(self) -> None:
+        """Close the event loop used by run_sync(); a later call opens a new one."""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
+
     async def execute_async(
         self,
         task: dict[str, Any] | str,
@@ -231,8 +305,6 @@ Key principles:
 
         # Simulate interplanetary latency if enabled
         if self.config.latency.simulate_latency:
-            import random
-
             delay = random.uniform(
                 self.config.latency.min_delay_seconds,
                 self.config.latency.max_delay_seconds,
@@ -260,6 +332,7 @@ Key principles:
                     **task_metadata,
                 },
                 model_response=response,
+                execution_id=execution_id,
             )
 
         except Exception as e:
@@ -269,20 +342,21 @@ Key principles:
                 success=False,
                 error=str(e),
                 metadata={"execution_id": execution_id},
+                execution_id=execution_id,
             )
 
-        # Record audit trail
-        end_time = datetime.now(UTC)
-        audit_entry = {
-            "execution_id": execution_id,
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat(),
-            "duration_ms": (end_time - start_time).total_seconds() * 1000,
-            "success": result.success,
-            "prompt_length": len(prompt),
-            "response_length": len(result.content),
-            "backend": self.config.model.backend,
-        }
+        # Record audit trail; the result's creation time doubles as end time
+        end_time = result.timestamp
+        audit_entry = ExecutionLogEntry(
+            execution_id=execution_id,
+            start_time=start_time.isoformat(),
+            end_time=end_time.isoformat(),
+            duration_ms=(end_time - start_time).total_seconds() * 1000,
+            success=result.success,
+            prompt_length=len(prompt),
+            response_length=len(result.content),
+            backend=self.config.model.backend,
+        )
 
         if self.config.governance.audit_enabled:
             self._audit_log.append(audit_entry)
@@ -299,17 +373,50 @@ Key principles:
                     metadata={
                         "execution_id": execution_id,
                         "backend": self.config.model.backend,
-                        "duration_ms": audit_entry["duration_ms"],
+                        "duration_ms": audit_entry.duration_ms,
                     },
+                    timestamp=end_time,
                 )
 
-        self.logger.info(
-            "Execution complete",
-            extra=audit_entry,
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Execution complete",
+                extra=audit_entry.to_dict(),
+            )
 
         return result
 
+    async def execute_batch_async(
+        self,
+        tasks: list[dict[str, Any] | str],
+        *,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> list[ExecutionResult]:
+        """
+        Execute several tasks concurrently.
+
+        At most ``config.model.max_parallel`` backend calls are in flight
+        at once; each task is audited exactly as with execute_async.
+
+        Args:
+            tasks: Task specifications (dicts with 'prompt' key or strings)
+            system_prompt: Override system prompt
+            **kwargs: Additional parameters passed to model
+
+        Returns:
+            ExecutionResults in the same order as tasks
+        """
+        semaphore = asyncio.Semaphore(self.config.model.max_parallel)
+
+        async def run_bounded(task: dict[str, Any] | str) -> ExecutionResult:
+            async with semaphore:
+                return await self.execute_async(
+                    task, system_prompt=system_prompt, **kwargs
+                )
+
+        return list(await asyncio.gather(*(run_bounded(t) for t in tasks)))
+
     async def health_check(self) -> dict[str, Any]:
         """
         Check system health.
@@ -345,14 +452,14 @@ Key principles:
         return result
 
     def get_audit_log(self) -> list[dict[str, Any]]:
-        """Get the audit log of all executions."""
-        return self._audit_log.copy()
+        """Get the audit log of recent executions, oldest first."""
+        return [entry.to_dict() for entry in self._audit_log]
 
     def export_audit_log(self, path: str | Path) -> None:
         """Export audit log to a JSON file."""
         path = Path(path)
         with open(path, "w") as f:
-            json.dump(self._audit_log, f, indent=2)
+            write_json_array((entry.to_dict() for entry in self._audit_log), f)
         self.logger.info(f"Exported audit log to {path}")
 
     def run(self) -> None:
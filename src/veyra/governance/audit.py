@@ -7,11 +7,49 @@ Provides complete, tamper-evident audit logging for all Veyra operations.
 import hashlib
 import json
 import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+# Optional: orjson encodes persisted audit lines several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def write_json_array(items: Iterable[dict[str, Any]], fp: TextIO) -> None:
+    """
+    Stream items to fp as a JSON array, one object at a time.
+
+    The output matches ``json.dump(list(items), fp, indent=2)`` without
+    building the whole list or the whole document in memory.
+    """
+    separator = "[\n  "
+    for item in items:
+        fp.write(separator)
+        # JSON strings never contain raw newlines, so this only re-indents
+        fp.write(json.dumps(item, indent=2).replace("\n", "\n  "))
+        separator = ",\n  "
+    fp.write("[]" if separator == "[\n  " else "\n]")
+
+
+def _json_line(data: dict[str, Any]) -> str:
+    """Encode data as one newline-terminated JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            ).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) use stdlib json
+            pass
+    return json.dumps(data) + "\n"
 
 
 class AuditEventType(Enum):
@@ -26,9 +64,14 @@ class AuditEventType(Enum):
     SYSTEM = "system"
 
 
-@dataclass
+@dataclass(frozen=True)
 class AuditEntry:
-    """A single audit log entry."""
+    """
+    A single audit log entry.
+
+    Frozen so that an entry cannot change after its hash is sealed, which
+    lets AuditTrail verify each entry once rather than on every check.
+    """
 
     event_type: AuditEventType
     timestamp: datetime
@@ -52,26 +95,44 @@ class AuditEntry:
     previous_hash: str | None = None
     entry_hash: str | None = None
 
+    # Derived once in __post_init__: the event type's string value, the
+    # ISO-formatted timestamp and the canonical bytes covered by entry_hash
+    _event_type_value: str = field(init=False, repr=False, compare=False)
+    _timestamp_iso: str = field(init=False, repr=False, compare=False)
+    _payload: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_event_type_value", self.event_type.value)
+        object.__setattr__(self, "_timestamp_iso", self.timestamp.isoformat())
+        # The payload is these fields in this fixed order, each UTF-8 encoded
+        # and prefixed with its byte length ("<len>:<bytes>"), so no choice of
+        # field contents gives two different entries the same payload; a missing
+        # previous_hash is empty.
+        fields = (
+            self.event_id,
+            self._event_type_value,
+            self._timestamp_iso,
+            self.actor,
+            self.action,
+            self.resource,
+            self.outcome,
+            self.previous_hash or "",
+        )
+        payload = b"".join(
+            b"%d:%b" % (len(data), data) for data in map(str.encode, fields)
+        )
+        object.__setattr__(self, "_payload", payload)
+
     def compute_hash(self) -> str:
         """Compute hash of this entry."""
-        data = {
-            "event_id": self.event_id,
-            "event_type": self.event_type.value,
-            "timestamp": self.timestamp.isoformat(),
-            "actor": self.actor,
-            "action": self.action,
-            "resource": self.resource,
-            "outcome": self.outcome,
-            "previous_hash": self.previous_hash,
-        }
-        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        return hashlib.sha256(self._payload).hexdigest()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
             "event_id": self.event_id,
-            "event_type": self.event_type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "event_type": self._event_type_value,
+            "timestamp": self._timestamp_iso,
             "actor": self.actor,
             "actor_type": self.actor_type,
             "action": self.action,
@@ -100,9 +161,20 @@ class AuditTrail:
             persist_path: Optional path to persist audit log
         """
         self._entries: list[AuditEntry] = []
+        # Per-value views of _entries, in recording order, for get_entries
+        self._by_type: defaultdict[AuditEventType, list[AuditEntry]] = defaultdict(
+            list
+        )
+        self._by_actor: defaultdict[str, list[AuditEntry]] = defaultdict(list)
         self._persist_path = persist_path
+        self._persist_file: TextIO | None = None
         self._last_hash: str | None = None
 
+        # Entries are immutable and only ever appended, so the prefix that
+        # verify_integrity has already checked never needs re-hashing.
+        self._verified_count = 0
+        self._verified_hash: str | None = None
+
     def record(
         self,
         event_type: AuditEventType,
@@ -113,6 +185,7 @@ class AuditTrail:
         input_summary: str | None = None,
         output_summary: str | None = None,
         metadata: dict[str, Any] | None = None,
+        timestamp: datetime | None = None,
     ) -> AuditEntry:
         """
         Record an audit event.
@@ -126,13 +199,14 @@ class AuditTrail:
             input_summary: Summary of input (not full data for privacy)
             output_summary: Summary of output
             metadata: Additional metadata
+            timestamp: When the event happened (defaults to now)
 
         Returns:
             The created audit entry
         """
         entry = AuditEntry(
             event_type=event_type,
-            timestamp=datetime.now(UTC),
+            timestamp=timestamp or datetime.now(UTC),
             actor=actor,
             action=action,
             resource=resource,
@@ -143,11 +217,13 @@ class AuditTrail:
             previous_hash=self._last_hash,
         )
 
-        # Compute and store hash
-        entry.entry_hash = entry.compute_hash()
+        # Compute and store hash; this is the one write to a sealed entry
+        object.__setattr__(entry, "entry_hash", entry.compute_hash())
         self._last_hash = entry.entry_hash
 
         self._entries.append(entry)
+        self._by_type[event_type].append(entry)
+        self._by_actor[actor].append(entry)
 
         # Persist if configured
         if self._persist_path:
@@ -159,21 +235,33 @@ class AuditTrail:
         """Append entry to persistent storage."""
         if self._persist_path is None:
             return
-        with open(self._persist_path, "a") as f:
-            f.write(json.dumps(entry.to_dict()) + "\n")
+        if self._persist_file is None:
+            # Opened once and kept; line buffering still hands each entry to
+            # the OS as soon as it is written.
+            self._persist_file = open(self._persist_path, "a", buffering=1)
+        self._persist_file.write(_json_line(entry.to_dict()))
+
+    def close(self) -> None:
+        """Close the persistence file; a later record() reopens it."""
+        if self._persist_file is not None:
+            self._persist_file.close()
+            self._persist_file = None
 
     def verify_integrity(self) -> tuple[bool, str | None]:
         """
         Verify the integrity of the audit chain.
 
+        Only entries recorded since the last successful check are re-hashed.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not self._entries:
-            return True, None
+        entries = self._entries
+        start = self._verified_count
+        previous_hash = self._verified_hash
+        for i in range(start, len(entries)):
+            entry = entries[i]
 
-        previous_hash = None
-        for i, entry in enumerate(self._entries):
             # Check previous hash linkage
             if entry.previous_hash != previous_hash:
                 return False, f"Hash chain broken at entry {i}"
@@ -185,6 +273,8 @@ class AuditTrail:
 
             previous_hash = entry.entry_hash
 
+        self._verified_count = len(entries)
+        self._verified_hash = previous_hash
         return True, None
 
     def get_entries(
@@ -207,20 +297,41 @@ class AuditTrail:
             List of matching entries
         """
         entries = self._entries
-
-        if event_type:
-            entries = [e for e in entries if e.event_type == event_type]
-        if actor:
-            entries = [e for e in entries if e.actor == actor]
+        filters: list[Callable[[AuditEntry], bool]] = []
+
+        # Start from the smaller index, then filter on the other dimension
+        if event_type and actor:
+            by_type = self._by_type.get(event_type, [])
+            by_actor = self._by_actor.get(actor, [])
+            if len(by_type) <= len(by_actor):
+                entries = by_type
+                filters.append(lambda e: e.actor == actor)
+            else:
+                entries = by_actor
+                filters.append(lambda e: e.event_type == event_type)
+        elif event_type:
+            entries = self._by_type.get(event_type, [])
+        elif actor:
+            entries = self._by_actor.get(actor, [])
         if since:
-            entries = [e for e in entries if e.timestamp >= since]
+            filters.append(lambda e: e.timestamp >= since)
+
+        if filters:
+            # Scan newest first so a limited query stops after `limit` matches
+            matches = (e for e in reversed(entries) if all(f(e) for f in filters))
+            if limit > 0:
+                tail = list(islice(matches, limit))
+                tail.reverse()
+                return tail
+            entries = list(matches)
+            entries.reverse()
 
         return entries[-limit:]
 
     def export(self, path: Path) -> None:
         """Export full audit trail to file."""
         with open(path, "w") as f:
-            json.dump([e.to_dict() for e in self._entries], f, indent=2)
+            write_json_array((e.to_dict() for e in self._entries), f)
 
     def __len__(self) -> int:
         return len(self._entries)
@@ -4,6 +4,9 @@ Policy Engine
 Implements multi-stakeholder policy framework for governance decisions.
 """
 
+import time
+from bisect import insort
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -58,6 +61,11 @@ class Policy:
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+def _priority_key(policy: Policy) -> int:
+    """Sort key placing higher-priority policies first."""
+    return -policy.priority
+
+
 class PolicyEngine:
     """
     Evaluates policies for governance decisions.
@@ -68,6 +76,9 @@ class PolicyEngine:
     - Multi-stakeholder policy composition
     """
 
+    # Most (action, jurisdiction) pairs whose candidate policies are kept
+    APPLICABLE_CACHE_SIZE = 1024
+
     def __init__(self, default_decision: PolicyDecision = PolicyDecision.ALLOW):
         """
         Initialize policy engine.
@@ -76,19 +87,59 @@ class PolicyEngine:
             default_decision: Decision when no policies match
         """
         self._policies: list[Policy] = []
+        # Policies that apply to every action, and per action the policies
+        # that apply to it (including those); all in evaluation order
+        self._any_action: list[Policy] = []
+        self._by_action: dict[str, list[Policy]] = {}
+        # LRU of policies matching (action, jurisdiction), in evaluation order
+        self._applicable: OrderedDict[tuple[str, str], tuple[Policy, ...]] = (
+            OrderedDict()
+        )
         self.default_decision = default_decision
 
     def add_policy(self, policy: Policy) -> None:
-        """Add a policy to the engine."""
-        self._policies.append(policy)
-        # Sort by priority (descending)
-        self._policies.sort(key=lambda p: p.priority, reverse=True)
+        """
+        Add a policy to the engine.
+
+        The policy is indexed by its applies_to actions when added; to
+        change applies_to later, remove the policy and add it again.
+        """
+        self._applicable.clear()
+        # Keep sorted by priority (descending); ties stay in insertion order
+        insort(self._policies, policy, key=_priority_key)
+
+        if policy.applies_to:
+            buckets = []
+            for action in dict.fromkeys(policy.applies_to):
+                if action not in self._by_action:
+                    self._by_action[action] = list(self._any_action)
+                buckets.append(self._by_action[action])
+        else:
+            buckets = [self._any_action, *self._by_action.values()]
+        for bucket in buckets:
+            insort(bucket, policy, key=_priority_key)
 
     def remove_policy(self, name: str) -> bool:
         """Remove a policy by name."""
         original_len = len(self._policies)
         self._policies = [p for p in self._policies if p.name != name]
-        return len(self._policies) < original_len
+        if len(self._policies) == original_len:
+            return False
+
+        self._applicable.clear()
+        self._any_action = [p for p in self._any_action if p.name != name]
+        for action, bucket in self._by_action.items():
+            self._by_action[action] = [p for p in bucket if p.name != name]
+        return True
+
+    def invalidate_cache(self) -> None:
+        """
+        Forget cached policy lookups.
+
+        Call after changing a registered policy's jurisdiction in place;
+        add_policy and remove_policy invalidate automatically.
+        """
+        self._applicable.clear()
 
     def evaluate(
         self,
@@ -107,14 +158,22 @@ class PolicyEngine:
         Returns:
             PolicyResult with decision and reasoning
         """
-        # Find applicable policies
-        applicable = [
-            p
-            for p in self._policies
-            if p.enabled
-            and (not p.applies_to or action in p.applies_to)
-            and (p.jurisdiction in ("global", jurisdiction))
-        ]
+        # Find applicable policies; enabled is checked per call so that
+        # toggling a policy takes effect without invalidating the cache
+        key = (action, jurisdiction)
+        candidates = self._applicable.get(key)
+        if candidates is None:
+            candidates = tuple(
+                p
+                for p in self._by_action.get(action, self._any_action)
+                if p.jurisdiction in ("global", jurisdiction)
+            )
+            self._applicable[key] = candidates
+            if len(self._applicable) > self.APPLICABLE_CACHE_SIZE:
+                self._applicable.popitem(last=False)
+        else:
+            self._applicable.move_to_end(key)
+        applicable = [p for p in candidates if p.enabled]
 
         if not applicable:
             return PolicyResult(
@@ -130,19 +189,19 @@ class PolicyEngine:
             try:
                 decision = policy.evaluate(context)
 
-                if decision == PolicyDecision.DENY:
+                if decision is PolicyDecision.DENY:
                     return PolicyResult(
                         decision=PolicyDecision.DENY,
                         policy_name=policy.name,
                         reason=f"Denied by policy: {policy.description}",
                     )
-                elif decision == PolicyDecision.REQUIRE_APPROVAL:
+                elif decision is PolicyDecision.REQUIRE_APPROVAL:
                     return PolicyResult(
                         decision=PolicyDecision.REQUIRE_APPROVAL,
                         policy_name=policy.name,
                         reason=f"Requires approval: {policy.description}",
                     )
-                elif decision == PolicyDecision.AUDIT:
+                elif decision is PolicyDecision.AUDIT:
                     audit_policies.append(policy.name)
 
             except Exception as e:
@@ -191,13 +250,15 @@ def create_rate_limit_policy(
     window_seconds: int,
 ) -> Policy:
     """Create a rate limiting policy."""
-    request_times: list[datetime] = []
+    # Monotonic times of allowed requests, oldest first
+    request_times: deque[float] = deque()
 
     def evaluate(_context: dict[str, Any]) -> PolicyDecision:
-        now = datetime.now(UTC)
-        # Clean old requests
-        cutoff = now.timestamp() - window_seconds
-        request_times[:] = [t for t in request_times if t.timestamp() > cutoff]
+        now = time.monotonic()
+        # Drop requests that have left the window
+        cutoff = now - window_seconds
+        while request_times and request_times[0] <= cutoff:
+            request_times.popleft()
 
         if len(request_times) >= max_requests:
             return PolicyDecision.DENY
@@ -220,7 +281,22 @@ def create_content_filter_policy(
     """Create a content filtering policy."""
     import re
 
-    patterns = [re.compile(p, re.IGNORECASE) for p in blocked_patterns]
+    compiled = [re.compile(p, re.IGNORECASE) for p in blocked_patterns]
+
+    # Patterns without capture groups are searched as one alternation, so
+    # the content is scanned once for all of them. Patterns with groups
+    # stay separate: in an alternation their numbered backreferences
+    # would point at other patterns' groups.
+    patterns = [p for p in compiled if p.groups]
+    simple = [p for p in compiled if not p.groups]
+    if len(simple) > 1:
+        try:
+            combined = "|".join(f"(?:{p.pattern})" for p in simple)
+            simple = [re.compile(combined, re.IGNORECASE)]
+        except re.error:
+            # e.g. global inline flags, which are only valid at the start
+            pass
+    patterns[:0] = simple
 
     def evaluate(context: dict[str, Any]) -> PolicyDecision:
         content = str(context.get("content", ""))
@@ -6,16 +6,70 @@ Provides consistent, structured logging across all Veyra components.
 
 import json
 import logging
+import math
 import sys
-from datetime import UTC, datetime
+import time
+
+# Optional: orjson encodes structured log records several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Standard LogRecord attributes; anything else on a record came from `extra`
+_RESERVED_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "thread",
+        "threadName",
+        "message",
+        "taskName",
+    }
+)
+
+# Extra values of these types are always JSON-serializable as they are
+_JSON_SCALARS = (str, int, float, bool, type(None))
 
 
 class StructuredFormatter(logging.Formatter):
     """JSON-structured log formatter for production use."""
 
+    # Last whole second formatted, so records within one second reuse it
+    _second: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record's creation time as an ISO 8601 UTC timestamp."""
+        # Same rounding as datetime.fromtimestamp
+        fraction, whole_float = math.modf(created)
+        whole, micros = int(whole_float), round(fraction * 1_000_000)
+        if micros == 1_000_000:
+            whole, micros = whole + 1, 0
+        second, prefix = self._second
+        if whole != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(whole))
+            self._second = (whole, prefix)
+        return f"{prefix}.{micros:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -24,40 +78,27 @@ class StructuredFormatter(logging.Formatter):
         # Add extra fields
         if hasattr(record, "__dict__"):
             for key, value in record.__dict__.items():
-                if key not in (
-                    "name",
-                    "msg",
-                    "args",
-                    "created",
-                    "filename",
-                    "funcName",
-                    "levelname",
-                    "levelno",
-                    "lineno",
-                    "module",
-                    "msecs",
-                    "pathname",
-                    "process",
-                    "processName",
-                    "relativeCreated",
-                    "stack_info",
-                    "exc_info",
-                    "exc_text",
-                    "thread",
-                    "threadName",
-                    "message",
-                    "taskName",
-                ):
-                    try:
-                        json.dumps(value)  # Test if serializable
-                        log_data[key] = value
-                    except (TypeError, ValueError):
-                        log_data[key] = str(value)
+                if key in _RESERVED_ATTRS:
+                    continue
+                if isinstance(value, _JSON_SCALARS):
+                    log_data[key] = value
+                    continue
+                try:
+                    json.dumps(value)  # Test if serializable
+                    log_data[key] = value
+                except (TypeError, ValueError):
+                    log_data[key] = str(value)
 
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # Values orjson rejects (e.g. ints beyond 64 bits) use stdlib json
+                pass
         return json.dumps(log_data)
 
 
@@ -73,42 +114,26 @@ class PrettyFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    # Last whole second formatted, so records within one second reuse it
+    _second: tuple[int, str] = (-1, "")
+
     def format(self, record: logging.LogRecord) -> str:
         color = self.COLORS.get(record.levelname, "")
         reset = self.RESET if color else ""
 
         # Format base message
-        timestamp = datetime.now(UTC).strftime("%H:%M:%S")
+        whole = int(record.created)
+        second, timestamp = self._second
+        if whole != second:
+            timestamp = time.strftime("%H:%M:%S", time.gmtime(whole))
+            self._second = (whole, timestamp)
         base = f"{color}{timestamp} [{record.levelname:7}]{reset} {record.name}: {record.getMessage()}"
 
         # Add extra fields
         extras = []
         if hasattr(record, "__dict__"):
             for key, value in record.__dict__.items():
-                if key not in (
-                    "name",
-                    "msg",
-                    "args",
-                    "created",
-                    "filename",
-                    "funcName",
-                    "levelname",
-                    "levelno",
-                    "lineno",
-                    "module",
-                    "msecs",
-                    "pathname",
-                    "process",
-                    "processName",
-                    "relativeCreated",
-                    "stack_info",
-                    "exc_info",
-                    "exc_text",
-                    "thread",
-                    "threadName",
-                    "message",
-                    "taskName",
-                ):
+                if key not in _RESERVED_ATTRS:
                     extras.append(f"{key}={value}")
 
         if extras:
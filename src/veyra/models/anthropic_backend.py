@@ -4,6 +4,7 @@ Anthropic Model Backend
 Adapter for Anthropic's Claude models.
 """
 
+import asyncio
 import os
 import uuid
 from datetime import UTC, datetime
@@ -17,6 +18,26 @@ try:
 except ImportError:
     AsyncAnthropic = None  # type: ignore[misc, assignment]
 
+# Clients shared by every backend using the same API key, so they share one
+# HTTP connection pool. Kept per event loop because an async client's pool
+# is bound to the loop it first ran on. Keyed by id(loop) rather than weakly:
+# the clients reference their loop, so a weak key would never be collected.
+# Entries for loops that have since closed are dropped whenever a new loop
+# is registered.
+_CLIENTS: dict[int, tuple[asyncio.AbstractEventLoop, dict[str, Any]]] = {}
+
+
+def _loop_clients() -> dict[str, Any]:
+    """Return the API-key-to-client map for the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _CLIENTS.get(id(loop))
+    if entry is None or entry[0] is not loop:
+        for key, (other, _clients) in list(_CLIENTS.items()):
+            if other.is_closed():
+                del _CLIENTS[key]
+        entry = _CLIENTS[id(loop)] = (loop, {})
+    return entry[1]
+
 
 class AnthropicBackend(BaseModelBackend):
     """
@@ -43,26 +64,26 @@ class AnthropicBackend(BaseModelBackend):
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
-        self._client: Any = None
 
     def _get_client(self) -> Any:
-        """Lazy-load the Anthropic client."""
-        if self._client is None:
-            if AsyncAnthropic is None:
-                raise ImportError(
-                    "Anthropic package not installed. "
-                    "Install with: pip install veyra[anthropic]"
-                )
-
-            if not self.api_key:
-                raise ValueError(
-                    "Anthropic API key not found. "
-                    "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
-                )
-
-            self._client = AsyncAnthropic(api_key=self.api_key)
-
-        return self._client
+        """Get the shared Anthropic client for this key on the running loop."""
+        if AsyncAnthropic is None:
+            raise ImportError(
+                "Anthropic package not installed. "
+                "Install with: pip install veyra[anthropic]"
+            )
+
+        if not self.api_key:
+            raise ValueError(
+                "Anthropic API key not found. "
+                "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
+            )
+
+        clients = _loop_clients()
+        client = clients.get(self.api_key)
+        if client is None:
+            client = clients[self.api_key] = AsyncAnthropic(api_key=self.api_key)
+        return client
 
     async def generate(
         self,
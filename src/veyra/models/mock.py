@@ -6,10 +6,13 @@ No API keys required.
 """
 
 import asyncio
-import hashlib
 import random
+import time
 import uuid
+import zlib
+from collections.abc import Callable
 from datetime import UTC, datetime
+from string import Formatter
 from typing import Any
 
 from veyra.models.base import BaseModelBackend, ModelResponse
@@ -28,6 +31,14 @@ class MockBackend(BaseModelBackend):
 
     name = "mock"
 
+    # Template keywords, checked in order; the first group with any
+    # keyword in the lowercased prompt picks the template
+    TEMPLATE_KEYWORDS = (
+        ("analyze", ("analyze", "analysis", "examine")),
+        ("recommend", ("recommend", "suggest", "advise")),
+        ("plan", ("plan", "strategy", "schedule")),
+    )
+
     def __init__(
         self,
         latency_range: tuple[float, float] = (0.1, 0.5),
@@ -67,6 +78,41 @@ class MockBackend(BaseModelBackend):
             "escalate to human oversight",
         ]
 
+        # Placeholder values; the random ones are drawn only when the
+        # chosen template references them
+        self._fixed_values: dict[str, Any] = {
+            "outcome": "positive trajectory with manageable risk",
+            "risk": "low to moderate",
+            "step1": "Establish baseline measurements",
+            "step2": "Implement monitoring protocols",
+            "step3": "Execute optimization sequence",
+            "resources": "standard allocation",
+        }
+        self._random_values: dict[str, Callable[[random.Random], Any]] = {
+            "count": lambda rng: rng.randint(2, 7),
+            "finding": lambda rng: rng.choice(self._findings),
+            "confidence": lambda rng: rng.randint(70, 99),
+            "action": lambda rng: rng.choice(self._actions),
+            "timeline": lambda rng: f"{rng.randint(1, 4)} operational cycles",
+            "complexity": lambda rng: rng.choice(["low", "moderate", "high"]),
+        }
+
+        # Random placeholders used by each template, in order of appearance
+        self._template_draws = {
+            key: tuple(
+                dict.fromkeys(
+                    name
+                    for _, name, _, _ in Formatter().parse(template)
+                    if name in self._random_values
+                )
+            )
+            for key, template in self._templates.items()
+        }
+
+        # Shared generator for non-deterministic mode; seeding a fresh one
+        # from the OS on every call costs more than rendering
+        self._rng = random.Random()
+
     async def generate(
         self,
         prompt: str,
@@ -80,59 +126,25 @@ class MockBackend(BaseModelBackend):
         # Unused parameters (for interface compatibility)
         _ = system_prompt, temperature, max_tokens, kwargs
 
-        start_time = datetime.now(UTC)
+        start = time.perf_counter()
 
         # Simulate network latency
         latency = random.uniform(*self.latency_range)
         await asyncio.sleep(latency)
 
-        # Generate deterministic seed from prompt if needed
-        if self.deterministic:
-            seed = int(hashlib.md5(prompt.encode()).hexdigest()[:8], 16)
-            rng = random.Random(seed)
-        else:
-            rng = random.Random()
-
-        # Select template based on prompt keywords
-        template_key = "default"
-        prompt_lower = prompt.lower()
-        if any(word in prompt_lower for word in ["analyze", "analysis", "examine"]):
-            template_key = "analyze"
-        elif any(word in prompt_lower for word in ["recommend", "suggest", "advise"]):
-            template_key = "recommend"
-        elif any(word in prompt_lower for word in ["plan", "strategy", "schedule"]):
-            template_key = "plan"
-
-        # Generate response content
-        template = self._templates[template_key]
-        content = template.format(
-            count=rng.randint(2, 7),
-            finding=rng.choice(self._findings),
-            confidence=rng.randint(70, 99),
-            action=rng.choice(self._actions),
-            outcome="positive trajectory with manageable risk",
-            risk="low to moderate",
-            step1="Establish baseline measurements",
-            step2="Implement monitoring protocols",
-            step3="Execute optimization sequence",
-            timeline=f"{rng.randint(1, 4)} operational cycles",
-            resources="standard allocation",
-            input_len=len(prompt),
-            complexity=rng.choice(["low", "moderate", "high"]),
-        )
+        content = self.render(prompt)
 
         # Calculate simulated token counts
         prompt_tokens = len(prompt.split()) * 2  # Rough approximation
         completion_tokens = len(content.split()) * 2
 
-        end_time = datetime.now(UTC)
-        latency_ms = (end_time - start_time).total_seconds() * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
 
         return ModelResponse(
             content=content,
             model="veyra-mock",
             backend=self.name,
-            created_at=end_time,
+            created_at=datetime.now(UTC),
             latency_ms=latency_ms,
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
@@ -140,6 +152,42 @@ class MockBackend(BaseModelBackend):
             request_id=str(uuid.uuid4()),
         )
 
+    def render(self, prompt: str) -> str:
+        """
+        Build the mock response text for a prompt without simulated latency.
+
+        Args:
+            prompt: The user prompt
+
+        Returns:
+            The content generate() would return for this prompt
+        """
+        # Generate deterministic seed from prompt if needed
+        if self.deterministic:
+            # CRC-32 is a stable 32-bit seed; unlike hash() it does not
+            # change between interpreter runs
+            rng = random.Random(zlib.crc32(prompt.encode()))
+        else:
+            rng = self._rng
+
+        template_key = self._template_key(prompt)
+        values = {
+            name: self._random_values[name](rng)
+            for name in self._template_draws[template_key]
+        }
+        return self._templates[template_key].format_map(
+            {**self._fixed_values, **values, "input_len": len(prompt)}
+        )
+
+    def _template_key(self, prompt: str) -> str:
+        """Select the response template for a prompt by keyword."""
+        prompt_lower = prompt.lower()
+        for template_key, keywords in self.TEMPLATE_KEYWORDS:
+            for word in keywords:
+                if word in prompt_lower:
+                    return template_key
+        return "default"
+
     async def health_check(self) -> bool:
         """Mock backend is always healthy."""
         return True
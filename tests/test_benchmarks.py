@@ -2,6 +2,11 @@
 Tests for Benchmark Framework
 """
 
+import asyncio
+import os
+import subprocess
+import sys
+
 import pytest
 
 from veyra import VeyraCore
@@ -102,6 +107,143 @@ class TestBenchmarkRunner:
         assert result.passed_tasks + result.failed_tasks == 3
         assert 0.0 <= result.v_score <= 1.0
 
+    @pytest.mark.asyncio
+    async def test_run_family_bounds_concurrency(self):
+        """Test that tasks overlap but stay within max_parallel."""
+        veyra = VeyraCore()
+        veyra.config.model.max_parallel = 2
+        runner = BenchmarkRunner(veyra)
+
+        in_flight = 0
+        peak = 0
+        execute_async = veyra.execute_async
+
+        async def tracked(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await execute_async(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        veyra.execute_async = tracked  # type: ignore[method-assign]
+
+        result = await runner.run_family(
+            family=BenchmarkFamily.CPLC,
+            count=5,
+            difficulty=Difficulty.EASY,
+        )
+
+        assert result.total_tasks == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_family_keeps_task_order(self):
+        """Test that results follow task order when later tasks finish first."""
+        veyra = VeyraCore()
+        veyra.config.model.max_parallel = 3
+        runner = BenchmarkRunner(veyra)
+        benchmark = runner._get_benchmark(BenchmarkFamily.CPLC)
+
+        generated: list[BenchmarkTask] = []
+        generate_tasks = benchmark.generate_tasks
+
+        def recording(*args, **kwargs):
+            tasks = generate_tasks(*args, **kwargs)
+            generated.extend(tasks)
+            return tasks
+
+        benchmark.generate_tasks = recording  # type: ignore[method-assign]
+
+        delays = iter([0.03, 0.02, 0.01, 0.0, 0.0, 0.0])
+        execute_async = veyra.execute_async
+
+        async def staggered(*args, **kwargs):
+            await asyncio.sleep(next(delays))
+            return await execute_async(*args, **kwargs)
+
+        veyra.execute_async = staggered  # type: ignore[method-assign]
+
+        result = await runner.run_family(
+            family=BenchmarkFamily.CPLC,
+            count=6,
+            difficulty=Difficulty.EASY,
+        )
+
+        assert [r.task_id for r in result.results] == [t.task_id for t in generated]
+
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_repeat_prompts(self):
+        """Test that a cached prompt is scored without calling the backend."""
+        veyra = VeyraCore()
+        runner = BenchmarkRunner(veyra, cache_responses=True)
+        benchmark = CPLCBenchmark()
+        task = benchmark.generate_tasks(count=1, difficulty=Difficulty.EASY)[0]
+
+        calls = 0
+        execute_async = veyra.execute_async
+
+        async def counted(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await execute_async(*args, **kwargs)
+
+        veyra.execute_async = counted  # type: ignore[method-assign]
+
+        first = await runner._run_task(benchmark, task)
+        second = await runner._run_task(benchmark, task)
+
+        assert calls == 1
+        assert second.score == first.score
+        assert second.execution_time_seconds == 0.0
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_survives_runner(self, tmp_path):
+        """Test that responses stored at cache_path are reused by a new runner."""
+        cache_path = tmp_path / "bench.sqlite"
+        benchmark = CPLCBenchmark()
+        task = benchmark.generate_tasks(count=1, difficulty=Difficulty.EASY)[0]
+
+        first_runner = BenchmarkRunner(VeyraCore(), cache_path=cache_path)
+        first = await first_runner._run_task(benchmark, task)
+        first_runner.close()
+
+        veyra = VeyraCore()
+
+        async def unreachable(*args, **kwargs):
+            raise AssertionError("backend should not be called")
+
+        veyra.execute_async = unreachable  # type: ignore[method-assign]
+        second_runner = BenchmarkRunner(veyra, cache_path=cache_path)
+        second = await second_runner._run_task(benchmark, task)
+        second_runner.close()
+
+        assert second.success == first.success
+        assert second.output == first.output
+        assert second.execution_time_seconds == 0.0
+
+    @pytest.mark.asyncio
+    async def test_fast_mock_skips_execution(self):
+        """Test that fast_mock scores mock output without executing tasks."""
+        veyra = VeyraCore()
+
+        async def unreachable(*args, **kwargs):
+            raise AssertionError("execute_async should not be called")
+
+        veyra.execute_async = unreachable  # type: ignore[method-assign]
+        runner = BenchmarkRunner(veyra, fast_mock=True)
+
+        result = await runner.run_family(
+            family=BenchmarkFamily.CPLC,
+            count=4,
+            difficulty=Difficulty.EASY,
+        )
+
+        assert result.total_tasks == 4
+        assert all(r.output and r.execution_time_seconds == 0.0 for r in result.results)
+        assert len(veyra.get_audit_log()) == 0
+
     @pytest.mark.asyncio
     async def test_run_all(self):
         """Test running all benchmarks."""
@@ -117,6 +259,21 @@ class TestBenchmarkRunner:
         assert 0.0 <= result.v_score <= 1.0
         assert len(result.family_scores) > 0
 
+    @pytest.mark.asyncio
+    async def test_run_all_skips_unimplemented_families(self):
+        """Test that unimplemented families are skipped, not fatal."""
+        veyra = VeyraCore()
+        runner = BenchmarkRunner(veyra)
+
+        result = await runner.run_all(
+            count_per_family=2,
+            difficulty=Difficulty.EASY,
+            families=[BenchmarkFamily.MSGA, BenchmarkFamily.CPLC],
+        )
+
+        assert result.total_tasks == 2
+        assert list(result.family_scores) == ["CPLC"]
+
 
 class TestBenchmarkTask:
     """Test BenchmarkTask functionality."""
@@ -139,3 +296,22 @@ class TestBenchmarkTask:
 
         assert task.max_time_seconds == 300.0
         assert task.max_tokens == 4096
+
+
+class TestBenchmarkImports:
+    """Test lazy benchmark package exports."""
+
+    def test_base_import_does_not_load_runner(self):
+        """Importing the base classes should not pull in the runner or core."""
+        code = (
+            "import sys, veyra.benchmarks.base; "
+            "print('veyra.benchmarks.runner' in sys.modules, 'veyra.core' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert out.stdout.strip() == "False False"
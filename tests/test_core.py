@@ -2,6 +2,11 @@
 Tests for VeyraCore
 """
 
+import asyncio
+import os
+import subprocess
+import sys
+
 import pytest
 
 from veyra import VeyraConfig, VeyraCore
@@ -34,6 +39,37 @@ class TestVeyraCore:
         assert len(result.content) > 0
         assert result.execution_id is not None
 
+    def test_execute_reuses_event_loop(self):
+        """Test that repeated sync calls run on the same event loop."""
+        veyra = VeyraCore()
+        loops = []
+        execute_async = veyra.execute_async
+
+        async def recording(*args, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return await execute_async(*args, **kwargs)
+
+        async def health_loop():
+            return asyncio.get_running_loop()
+
+        veyra.execute_async = recording  # type: ignore[method-assign]
+        veyra.execute("First")
+        veyra.execute("Second")
+        health = veyra.health_check_sync()
+        loops.append(veyra.run_sync(health_loop()))
+        veyra.close()
+
+        assert loops[0] is loops[1] is loops[2]
+        assert health["status"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_execute_inside_running_loop(self):
+        """Test that execute points async callers at execute_async."""
+        veyra = VeyraCore()
+
+        with pytest.raises(RuntimeError, match="execute_async"):
+            veyra.execute("Hello Veyra")
+
     def test_execute_with_dict(self):
         """Test execution with dict input."""
         veyra = VeyraCore()
@@ -59,6 +95,18 @@ class TestVeyraCore:
         assert result.success
         assert len(result.content) > 0
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_async(self):
+        """Test batched execution keeps task order and audits each task."""
+        veyra = VeyraCore()
+        results = await veyra.execute_batch_async(
+            ["First", {"prompt": "Second", "tag": "b"}, ""]
+        )
+
+        assert [r.success for r in results] == [True, True, False]
+        assert results[1].metadata["tag"] == "b"
+        assert len(veyra.get_audit_log()) == 2
+
     @pytest.mark.asyncio
     async def test_health_check(self):
         """Test health check."""
@@ -80,6 +128,22 @@ class TestVeyraCore:
         audit = veyra.get_audit_log()
         assert len(audit) == 2
 
+        entry = veyra.audit_trail.get_entries()[-1]
+        assert entry.timestamp.isoformat() == audit[-1]["end_time"]
+
+    def test_audit_log_is_bounded(self):
+        """Test that the in-memory log keeps only the most recent executions."""
+        config = VeyraConfig()
+        config.governance.audit_log_size = 2
+        veyra = VeyraCore(config=config)
+
+        results = [veyra.execute(f"Test prompt {i}") for i in range(3)]
+
+        audit = veyra.get_audit_log()
+        assert [a["execution_id"] for a in audit] == [
+            r.execution_id for r in results[1:]
+        ]
+
     def test_result_to_dict(self):
         """Test result serialization."""
         veyra = VeyraCore()
@@ -90,6 +154,7 @@ class TestVeyraCore:
         assert "success" in result_dict
         assert "execution_id" in result_dict
         assert "timestamp" in result_dict
+        assert result.execution_id == result.metadata["execution_id"]
 
 
 class TestVeyraConfig:
@@ -114,6 +179,41 @@ class TestVeyraConfig:
         assert config.system_name == "TestVeyra"
         assert config.environment == "mars"
 
+    def test_from_yaml_returns_independent_instances(self, tmp_path):
+        """Test that repeat loads don't share mutable state."""
+        path = tmp_path / "config.yaml"
+        path.write_text("system:\n  name: Cached\nenvironment: mars\n")
+
+        first = VeyraConfig.from_yaml(path)
+        first.environment = "lunar"
+        second = VeyraConfig.from_yaml(path)
+
+        assert second.environment == "mars"
+        assert second.system_name == "Cached"
+
+    def test_from_yaml_sees_file_changes(self, tmp_path):
+        """Test that editing the file invalidates the parse cache."""
+        path = tmp_path / "config.yaml"
+        path.write_text("environment: mars\n")
+        assert VeyraConfig.from_yaml(path).environment == "mars"
+
+        path.write_text("environment: space\n")
+        assert VeyraConfig.from_yaml(path).environment == "space"
+
+    def test_env_overrides(self, monkeypatch):
+        """Test environment variable overrides."""
+        monkeypatch.setenv("VEYRA_BACKEND", "openai")
+        monkeypatch.setenv("VEYRA_ENVIRONMENT", "lunar")
+        monkeypatch.setenv("VEYRA_SIMULATE_LATENCY", "TRUE")
+        monkeypatch.setenv("VEYRA_WORLD_MODEL_ENABLED", "no")
+
+        config = VeyraConfig.from_env()
+
+        assert config.model.backend == "openai"
+        assert config.environment == "lunar"
+        assert config.latency.simulate_latency is True
+        assert config.world_model_enabled is False
+
     def test_model_config(self):
         """Test model configuration."""
         config = VeyraConfig()
@@ -122,3 +222,28 @@ class TestVeyraConfig:
 
         assert config.model.backend == "openai"
         assert config.model.openai_model == "gpt-4"
+
+
+class TestPackageImports:
+    """Test lazy package-level exports."""
+
+    def test_import_does_not_load_core(self):
+        """Importing the package alone should not pull in the core."""
+        code = "import sys, veyra; print('veyra.core' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_lazy_exports_resolve(self):
+        """Test that exported names resolve to the real objects."""
+        import veyra
+        from veyra.core import VeyraCore as CoreClass
+
+        assert veyra.VeyraCore is CoreClass
+        with pytest.raises(AttributeError):
+            veyra.does_not_exist  # noqa: B018
@@ -2,7 +2,11 @@
 Tests for Governance Layer
 """
 
-from datetime import UTC, datetime
+import dataclasses
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
 
 from veyra.governance import (
     AuditEntry,
@@ -42,6 +46,82 @@ class TestAuditTrail:
         assert is_valid
         assert error is None
 
+    def test_hash_separates_fields(self):
+        """Test that moving text between fields changes the hash."""
+        timestamp = datetime.now(UTC)
+        first = AuditEntry(
+            event_id="e1",
+            event_type=AuditEventType.EXECUTION,
+            timestamp=timestamp,
+            action="a\x1fb",
+            resource="c",
+        )
+        second = AuditEntry(
+            event_id="e1",
+            event_type=AuditEventType.EXECUTION,
+            timestamp=timestamp,
+            action="a",
+            resource="b\x1fc",
+        )
+
+        assert first.compute_hash() != second.compute_hash()
+
+    def test_verify_integrity_is_incremental(self, monkeypatch):
+        """Test that repeated verification only re-hashes new entries."""
+        trail = AuditTrail()
+        trail.record(AuditEventType.EXECUTION, "action1")
+        trail.record(AuditEventType.EXECUTION, "action2")
+        assert trail.verify_integrity() == (True, None)
+
+        hashed = []
+        compute_hash = AuditEntry.compute_hash
+
+        def counting(entry):
+            hashed.append(entry.action)
+            return compute_hash(entry)
+
+        monkeypatch.setattr(AuditEntry, "compute_hash", counting)
+        trail.record(AuditEventType.EXECUTION, "action3")
+        hashed.clear()
+
+        assert trail.verify_integrity() == (True, None)
+        assert hashed == ["action3"]
+
+    def test_entries_are_immutable(self):
+        """Test that recorded entries cannot be altered after sealing."""
+        trail = AuditTrail()
+        entry = trail.record(AuditEventType.EXECUTION, "action")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.outcome = "failure"  # type: ignore[misc]
+
+    def test_persist_appends_lines(self, tmp_path):
+        """Test that persisted entries are readable before and after close."""
+        path = tmp_path / "audit.jsonl"
+        trail = AuditTrail(persist_path=path)
+
+        trail.record(AuditEventType.EXECUTION, "action1")
+        assert len(path.read_text().splitlines()) == 1
+
+        trail.close()
+        trail.record(AuditEventType.EXECUTION, "action2")
+        trail.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["action"] for line in lines] == ["action1", "action2"]
+
+    def test_export_matches_indented_json(self, tmp_path):
+        """Test that the streamed export equals a one-shot indented dump."""
+        trail = AuditTrail()
+        trail.record(AuditEventType.EXECUTION, "action1", metadata={"k": [1, 2]})
+        trail.record(AuditEventType.ERROR, "action2", input_summary="a\nb")
+
+        path = tmp_path / "export.json"
+        trail.export(path)
+
+        expected = [e.to_dict() for e in trail.get_entries()]
+        assert path.read_text() == json.dumps(expected, indent=2)
+
     def test_get_entries(self):
         """Test querying entries."""
         trail = AuditTrail()
@@ -53,6 +133,39 @@ class TestAuditTrail:
         exec_entries = trail.get_entries(event_type=AuditEventType.EXECUTION)
         assert len(exec_entries) == 2
 
+    def test_get_entries_combined_filters(self):
+        """Test querying by event type and actor together, oldest first."""
+        trail = AuditTrail()
+
+        trail.record(AuditEventType.EXECUTION, "exec1", actor="alice")
+        trail.record(AuditEventType.EXECUTION, "exec2", actor="bob")
+        trail.record(AuditEventType.ERROR, "err1", actor="alice")
+        trail.record(AuditEventType.EXECUTION, "exec3", actor="alice")
+
+        entries = trail.get_entries(event_type=AuditEventType.EXECUTION, actor="alice")
+        assert [e.action for e in entries] == ["exec1", "exec3"]
+        assert [e.action for e in trail.get_entries(actor="alice", limit=1)] == [
+            "exec3"
+        ]
+        assert trail.get_entries(actor="nobody") == []
+
+    def test_get_entries_since_with_limit(self):
+        """Test that a limited time query returns the newest matches in order."""
+        trail = AuditTrail()
+        base = datetime(2026, 1, 1, tzinfo=UTC)
+
+        for minute in range(5):
+            trail.record(
+                AuditEventType.EXECUTION,
+                f"exec{minute}",
+                timestamp=base + timedelta(minutes=minute),
+            )
+
+        since = base + timedelta(minutes=1)
+        entries = trail.get_entries(since=since, limit=2)
+        assert [e.action for e in entries] == ["exec3", "exec4"]
+        assert len(trail.get_entries(since=since)) == 4
+
     def test_entry_to_dict(self):
         """Test entry serialization."""
         entry = AuditEntry(
@@ -147,6 +260,22 @@ class TestPolicyEngine:
         assert len(policies) == 1
         assert policies[0].name == "test"
 
+    def test_list_policies_priority_order(self):
+        """Test that policies list by descending priority, ties in add order."""
+        engine = PolicyEngine()
+
+        for name, priority in [("a", 1), ("b", 5), ("c", 1), ("d", 10), ("e", 5)]:
+            engine.add_policy(
+                Policy(
+                    name=name,
+                    description=name,
+                    evaluate=lambda _ctx: PolicyDecision.ALLOW,
+                    priority=priority,
+                )
+            )
+
+        assert [p.name for p in engine.list_policies()] == ["d", "b", "e", "a", "c"]
+
     def test_remove_policy(self):
         """Test removing a policy."""
         engine = PolicyEngine()
@@ -265,6 +394,42 @@ class TestPolicyEngine:
         result = engine.evaluate("restricted_action", {})
         assert result.decision == PolicyDecision.DENY
 
+    def test_action_policies_keep_priority_order(self):
+        """Test that global and action-specific policies interleave by priority."""
+        engine = PolicyEngine()
+
+        def audit(name, priority, applies_to=None):
+            engine.add_policy(
+                Policy(
+                    name=name,
+                    description=name,
+                    evaluate=lambda _ctx: PolicyDecision.AUDIT,
+                    priority=priority,
+                    applies_to=applies_to or [],
+                )
+            )
+
+        audit("any_low", 1)
+        audit("deploy_high", 10, ["deploy"])
+        audit("any_high", 10)
+        audit("deploy_low", 1, ["deploy", "launch"])
+
+        result = engine.evaluate("deploy", {})
+        assert result.conditions == ["deploy_high", "any_high", "any_low", "deploy_low"]
+        assert engine.evaluate("launch", {}).conditions == [
+            "any_high",
+            "any_low",
+            "deploy_low",
+        ]
+        assert engine.evaluate("other", {}).conditions == ["any_high", "any_low"]
+
+        engine.remove_policy("any_high")
+        assert engine.evaluate("deploy", {}).conditions == [
+            "deploy_high",
+            "any_low",
+            "deploy_low",
+        ]
+
     def test_policy_jurisdiction_filter(self):
         """Test policy jurisdiction filtering."""
         engine = PolicyEngine()
@@ -320,6 +485,28 @@ class TestPolicyEngine:
         result = engine.evaluate("action", {})
         assert result.decision == PolicyDecision.ALLOW
 
+    def test_cached_lookup_follows_policy_changes(self):
+        """Test that repeat evaluations see added, toggled and moved policies."""
+        engine = PolicyEngine()
+        assert engine.evaluate("action", {}).decision == PolicyDecision.ALLOW
+
+        policy = Policy(
+            name="deny",
+            description="Deny",
+            evaluate=lambda _ctx: PolicyDecision.DENY,
+        )
+        engine.add_policy(policy)
+        assert engine.evaluate("action", {}).decision == PolicyDecision.DENY
+
+        policy.enabled = False
+        assert engine.evaluate("action", {}).decision == PolicyDecision.ALLOW
+        policy.enabled = True
+
+        policy.jurisdiction = "mars"
+        engine.invalidate_cache()
+        assert engine.evaluate("action", {}, "earth").decision == PolicyDecision.ALLOW
+        assert engine.evaluate("action", {}, "mars").decision == PolicyDecision.DENY
+
     def test_list_policies_by_jurisdiction(self):
         """Test listing policies filtered by jurisdiction."""
         engine = PolicyEngine()
@@ -411,6 +598,27 @@ class TestPrebuiltPolicies:
         result = engine.evaluate("action", {})
         assert result.decision == PolicyDecision.DENY
 
+    def test_rate_limit_window_expires(self, monkeypatch):
+        """Test that requests older than the window no longer count."""
+        from veyra.governance import policy as policy_module
+
+        now = 1000.0
+        monkeypatch.setattr(policy_module.time, "monotonic", lambda: now)
+        policy = policy_module.create_rate_limit_policy(
+            name="rate_limit",
+            max_requests=2,
+            window_seconds=10,
+        )
+
+        assert policy.evaluate({}) == PolicyDecision.ALLOW
+        now += 5
+        assert policy.evaluate({}) == PolicyDecision.ALLOW
+        assert policy.evaluate({}) == PolicyDecision.DENY
+
+        now += 5  # First request is now exactly one window old
+        assert policy.evaluate({}) == PolicyDecision.ALLOW
+        assert policy.evaluate({}) == PolicyDecision.DENY
+
     def test_create_content_filter_policy(self):
         """Test content filtering policy."""
         from veyra.governance.policy import create_content_filter_policy
@@ -433,4 +641,18 @@ class TestPrebuiltPolicies:
 
         # Regex pattern should match
         result = engine.evaluate("action", {"content": "secret123"})
-        assert result.decision == PolicyDecision.DENY
\ No newline at end of file
+        assert result.decision == PolicyDecision.DENY
+
+    def test_content_filter_keeps_backreferences(self):
+        """Test that grouped patterns still match on their own groups."""
+        from veyra.governance.policy import create_content_filter_policy
+
+        policy = create_content_filter_policy(
+            name="content_filter",
+            blocked_patterns=["dangerous", r"(\w)\1{3}", r"(?i)shout"],
+        )
+
+        assert policy.evaluate({"content": "aaaa"}) == PolicyDecision.DENY
+        assert policy.evaluate({"content": "abcd"}) == PolicyDecision.ALLOW
+        assert policy.evaluate({"content": "SHOUT"}) == PolicyDecision.DENY
+        assert policy.evaluate({"content": "Dangerous"}) == PolicyDecision.DENY
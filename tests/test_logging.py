@@ -4,6 +4,7 @@ Tests for Logging Utilities
 
 import json
 import logging
+from datetime import UTC, datetime
 from io import StringIO
 from unittest.mock import patch
 
@@ -39,6 +40,25 @@ class TestStructuredFormatter:
         assert data["message"] == "Test message"
         assert "timestamp" in data
 
+    def test_timestamp_is_record_creation_time(self):
+        """Test that the timestamp is the record's creation time in UTC."""
+        formatter = StructuredFormatter()
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        for created in (1767225600.0, 1767225600.9999996, 1767225661.25):
+            record.created = created
+            data = json.loads(formatter.format(record))
+            expected = datetime.fromtimestamp(created, UTC)
+            assert datetime.fromisoformat(data["timestamp"]) == expected
+
     def test_format_with_extra(self):
         """Test formatting with extra fields."""
         formatter = StructuredFormatter()
@@ -2,6 +2,9 @@
 Tests for Model Backends
 """
 
+import asyncio
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from veyra.models import (
@@ -52,6 +55,15 @@ class TestMockBackend:
         # Just check they all have content
         assert all(len(r) > 0 for r in responses)
 
+    def test_render_template_selection(self):
+        """Test that earlier keyword groups win regardless of position."""
+        backend = MockBackend()
+
+        assert backend.render("Make a PLAN, then Analyze it").startswith("Analysis")
+        assert backend.render("Suggest a schedule").startswith("Recommendation")
+        assert backend.render("Planetary strategy").startswith("Strategic Plan")
+        assert backend.render("Hello").startswith("Veyra Mock Response")
+
     @pytest.mark.asyncio
     async def test_health_check(self):
         """Test health check."""
@@ -88,6 +100,46 @@ class TestMockBackend:
         assert len(response.request_id) > 0
 
 
+class TestAnthropicBackend:
+    """Test AnthropicBackend client handling."""
+
+    @pytest.mark.asyncio
+    async def test_backends_share_client_per_key(self):
+        """Test that backends with one key reuse one client on a loop."""
+        from veyra.models.anthropic_backend import AnthropicBackend
+
+        with patch("veyra.models.anthropic_backend.AsyncAnthropic") as client_class:
+            client_class.side_effect = lambda **_kwargs: MagicMock()
+
+            first = AnthropicBackend(api_key="key-a")._get_client()
+            second = AnthropicBackend(api_key="key-a")._get_client()
+            other = AnthropicBackend(api_key="key-b")._get_client()
+
+        assert first is second
+        assert other is not first
+
+    def test_closed_loop_clients_are_dropped(self):
+        """Test that clients of a closed loop are released on the next loop."""
+        from veyra.models import anthropic_backend
+
+        async def get_client():
+            return anthropic_backend.AnthropicBackend(api_key="key-a")._get_client()
+
+        with patch("veyra.models.anthropic_backend.AsyncAnthropic") as client_class:
+            client_class.side_effect = lambda **_kwargs: MagicMock()
+
+            first = asyncio.run(get_client())
+            second = asyncio.run(get_client())
+
+        cached = [
+            client
+            for _loop, clients in anthropic_backend._CLIENTS.values()
+            for client in clients.values()
+        ]
+        assert second in cached
+        assert first not in cached
+
+
 class TestBackendRegistry:
     """Test backend registry functionality."""
 
@@ -0,0 +1,191 @@
+"""
+Tests for Veyra Nano
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+import nano
+from nano import (
+    AuditEventType,
+    AuditTrail,
+    BackendError,
+    BaseBackend,
+    NanoConfig,
+    VeyraNano,
+)
+
+
+@pytest.fixture
+def trail(tmp_path):
+    """Create an AuditTrail backed by a temporary database."""
+    audit = AuditTrail(tmp_path / "audit.db")
+    yield audit
+    audit.close()
+
+
+def make_nano(trail: AuditTrail, **config) -> VeyraNano:
+    """Create a mock-backed VeyraNano that audits to the given trail."""
+    veyra = VeyraNano(NanoConfig(audit_enabled=False, **config))
+    veyra.audit = trail
+    return veyra
+
+
+class TestAuditTrail:
+    """Test the SQLite-backed audit trail."""
+
+    def test_record_many(self, trail):
+        """Test that record_many chains and stores every event."""
+        entries = trail.record_many([
+            (AuditEventType.EXECUTION, "a", "success", "in-a", 1, 1.0, None),
+            (AuditEventType.EXECUTION, "b", "success", "in-b", 2, 2.0, {"k": 1}),
+        ])
+
+        assert trail.count() == 2
+        assert entries[0].previous_hash is None
+        assert entries[1].previous_hash == entries[0].entry_hash
+        assert trail.verify_integrity() == (True, None)
+
+    def test_record_many_rolls_back_on_error(self, trail, monkeypatch):
+        """Test that a failed record_many writes nothing and keeps the tail."""
+        trail.record(AuditEventType.SYSTEM, "start", "success", "", 0, 0)
+        tail = trail._last_hash
+        # Identical event ids violate the UNIQUE constraint on the second row
+        monkeypatch.setattr(nano.os, "urandom", lambda n: bytes(n))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            trail.record_many([
+                (AuditEventType.EXECUTION, "a", "success", "in-a", 0, 0, None),
+                (AuditEventType.EXECUTION, "b", "success", "in-b", 0, 0, None),
+            ])
+
+        assert trail.count() == 1
+        assert trail._last_hash == tail
+
+    def test_batch_commits_on_exit(self, trail):
+        """Test that rows recorded in a batch reach SQLite when it exits."""
+        with trail.batch():
+            trail.record(AuditEventType.EXECUTION, "a", "success", "in-a", 0, 0)
+            trail.record_many([
+                (AuditEventType.EXECUTION, "b", "success", "in-b", 0, 0, None),
+            ])
+            assert trail.count() == 0
+
+        assert trail.count() == 2
+        assert trail.verify_integrity() == (True, None)
+
+    def test_batch_rolls_back_on_error(self, trail, monkeypatch):
+        """Test that a failed batch write restores the chain tail."""
+        trail.record(AuditEventType.SYSTEM, "start", "success", "", 0, 0)
+        tail = trail._last_hash
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with trail.batch():
+                monkeypatch.setattr(nano.secrets, "token_hex", lambda _n: "deadbeef")
+                trail.record(AuditEventType.EXECUTION, "a", "success", "", 0, 0)
+                trail.record(AuditEventType.EXECUTION, "b", "success", "", 0, 0)
+
+        assert trail.count() == 1
+        assert trail._last_hash == tail
+
+        monkeypatch.undo()
+        trail.record(AuditEventType.EXECUTION, "c", "success", "", 0, 0)
+        assert trail.verify_integrity() == (True, None)
+
+    def test_verify_integrity_accepts_legacy_json_hash(self, trail):
+        """Test that rows hashed as sorted-key JSON still verify."""
+        fields = {
+            "event_id": "legacy01",
+            "event_type": "execution",
+            "timestamp": "2025-01-01T00:00:00+00:00",
+            "action": "execute",
+            "outcome": "success",
+            "input_hash": "0" * 12,
+            "previous_hash": None,
+        }
+        legacy_hash = AuditTrail._compute_legacy_hash(fields)
+        trail._conn.execute(
+            nano._INSERT_SQL,
+            (
+                fields["event_id"], fields["event_type"], fields["timestamp"],
+                fields["action"], fields["outcome"], fields["input_hash"],
+                0, 0.0, None, legacy_hash, "{}",
+            ),
+        )
+        trail._last_hash = legacy_hash
+        trail.record(AuditEventType.EXECUTION, "next", "success", "", 0, 0)
+
+        assert trail.verify_integrity() == (True, None)
+
+        trail._conn.execute(
+            "UPDATE audit_log SET action = 'tampered' WHERE event_id = 'legacy01'"
+        )
+        valid, error = trail.verify_integrity()
+        assert not valid
+        assert "legacy01" in error
+
+
+class FailingBackend(BaseBackend):
+    """Backend whose every call fails."""
+    name = "failing"
+
+    async def generate(self, prompt, system, config):
+        raise BackendError("backend unavailable")
+
+
+class TestVeyraNano:
+    """Test VeyraNano execution."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_is_audited(self, trail):
+        """Test that a cached response is recorded as CACHE_HIT."""
+        veyra = make_nano(trail, cache_enabled=True)
+
+        first = await veyra.execute("Status report")
+        second = await veyra.execute("  Status   report ")
+
+        assert second.content == first.content
+        assert [row["event_type"] for row in trail.get_recent()] == [
+            AuditEventType.CACHE_HIT.value,
+            AuditEventType.EXECUTION.value,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_shared_latency_draws_one_delay(self, trail, monkeypatch):
+        """Test that concurrent executions share a single simulated delay."""
+        veyra = make_nano(
+            trail,
+            simulate_latency=True,
+            shared_latency=True,
+            latency_range=(0.01, 0.01),
+        )
+        draws = []
+        uniform = nano.random.uniform
+
+        def counting(a, b):
+            draws.append((a, b))
+            return uniform(a, b)
+
+        monkeypatch.setattr(nano.random, "uniform", counting)
+
+        results = await asyncio.gather(
+            *(veyra.execute(f"prompt {i}") for i in range(3))
+        )
+
+        assert all(r.success for r in results)
+        assert len(draws) == 1
+
+    @pytest.mark.asyncio
+    async def test_backend_error_becomes_failed_result(self, trail):
+        """Test that a BackendError yields an error result, not an exception."""
+        veyra = make_nano(trail)
+        veyra.backend = FailingBackend()
+
+        result = await veyra.execute("Hello")
+
+        assert not result.success
+        assert result.content == ""
+        assert result.error == "backend unavailable"
+        assert trail.get_recent(1)[0]["outcome"] == "error"